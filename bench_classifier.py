@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк проверки уязвимостей на принадлежность к пакетам.
+Работает на сохраненных ответах nist (NVD API 2.0), без сети, koji и трекера.
+
+Сохранить корпус можно, например, так (не больше 120 дней за запрос):
+curl -H "apiKey: $NIST_KEY" -o nvd_2024_03.json \
+    "https://services.nvd.nist.gov/rest/json/cves/2.0?pubStartDate=2024-03-01T00:00:00.000&pubEndDate=2024-03-31T23:59:59.999"
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import argparse
+from statistics import mean, median
+from pkg_handlers import PKG_RULES_PATH, PkgHandler, RuleEngine, CveFeatures, prepare_cve_input
+
+BENCH_BASELINE_PATH = f"{os.path.abspath(os.path.dirname(__file__))}/bench_baseline.json"
+# Допустимое замедление относительно baseline (0.25 - на 25%)
+BENCH_THRESHOLD = 0.25
+# То же для отдельного пакета: замеры по пакетам шумнее общего, поэтому порог выше
+BENCH_CHECKER_THRESHOLD = 1.0
+# Замедление пакета меньше этого (мкс на уязвимость) регрессией не считаем - там одни шумы
+BENCH_CHECKER_FLOOR_US = 1.0
+
+
+def load_corpus(paths: list) -> list:
+    """
+    Читает сохраненные ответы nist: файлы .json/.json.gz или папки с ними
+    :return: список элементов vulnerabilities
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(os.path.join(path, name) for name in os.listdir(path)
+                                if name.endswith(('.json', '.json.gz'))))
+        else:
+            files.append(path)
+
+    vulnerabilities = []
+    for file in files:
+        opener = gzip.open if file.endswith('.gz') else open
+        with opener(file, 'rt') as f:
+            data = json.load(f)
+        vulnerabilities.extend(data['vulnerabilities'] if isinstance(data, dict) else data)
+
+    return vulnerabilities
+
+
+def time_engine(engine: RuleEngine, features_list: list, repeat: int) -> (list, list):
+    """
+    :return: время проверки каждой уязвимости в мкс (лучшее из repeat прогонов) и вердикты
+    """
+    best = [float('inf')] * len(features_list)
+    verdicts = []
+    for _ in range(repeat):
+        verdicts = []
+        for n, features in enumerate(features_list):
+            start = time.perf_counter()
+            verdicts.append(engine.evaluate(features))
+            best[n] = min(best[n], (time.perf_counter() - start) * 1e6)
+
+    return best, verdicts
+
+
+def run_bench(vulnerabilities: list, pkg_rules: dict, repeat: int, per_checker: bool) -> dict:
+    start = time.perf_counter()
+    cve_inputs = [prepare_cve_input(cve) for cve in vulnerabilities]
+    features_list = [CveFeatures(*cve_input) for cve_input in cve_inputs]
+    prepare_us = (time.perf_counter() - start) * 1e6 / len(vulnerabilities)
+
+    engine = PkgHandler.make_rule_engine(pkg_rules)
+    per_cve, verdicts = time_engine(engine, features_list, repeat)
+
+    verdict_counts = {}
+    for cve_verdicts in verdicts:
+        for pkg_name, is_pkg in cve_verdicts.items():
+            counts = verdict_counts.setdefault(pkg_name, {})
+            counts[is_pkg.name] = counts.get(is_pkg.name, 0) + 1
+
+    checkers = {}
+    if per_checker:
+        # стоимость пакета - проверка движком только с его правилом за вычетом пустого движка.
+        # Разница "все правила минус правило пакета" тонет в шуме, а так видно, какие правила дороже остальных
+        overhead = mean(time_engine(PkgHandler.make_rule_engine({}), features_list, repeat)[0])
+        for pkg_name, rule in pkg_rules.items():
+            single = PkgHandler.make_rule_engine({pkg_name: rule})
+            checkers[pkg_name] = round(max(mean(time_engine(single, features_list, repeat)[0]) - overhead, 0), 3)
+
+    ids = [cve['cve']['id'] for cve in vulnerabilities]
+    return {
+        'cves': len(vulnerabilities),
+        'prepare_us': round(prepare_us, 3),
+        'per_cve_us': round(mean(per_cve), 3),
+        'median_us': round(median(per_cve), 3),
+        'p95_us': round(sorted(per_cve)[int(len(per_cve) * 0.95)], 3),
+        'slowest': [[ids[n], round(per_cve[n], 3)] for n in sorted(range(len(ids)), key=lambda n: -per_cve[n])[:5]],
+        'checkers': checkers,
+        'verdicts': verdict_counts,
+    }
+
+
+def check_matcher(vulnerabilities: list, pkg_rules: dict) -> list:
+    """
+    Сверяет однопроходный поиск KeywordMatcher с перебором (ключевые слова - токены описания,
+    фразы - подстроки), то есть с тем, как правила понимались изначально
+    :return: список расхождений
+    """
+    engine = PkgHandler.make_rule_engine(pkg_rules)
+    mismatches = []
+    for cve in vulnerabilities:
+        features = CveFeatures(*prepare_cve_input(cve))
+        fast, plain = engine.find_candidates(features), engine.find_candidates_plain(features)
+        if fast != plain:
+            mismatches.append(f"{cve['cve']['id']}: {sorted(fast[0] ^ plain[0])} {sorted(fast[1] ^ plain[1])}")
+
+    return mismatches
+
+
+def print_report(result: dict, top: int):
+    print(f"CVE в корпусе:             {result['cves']}")
+    print(f"Подготовка, мкс/CVE:       {result['prepare_us']}")
+    print(f"Проверка, мкс/CVE:         {result['per_cve_us']} "
+          f"(медиана {result['median_us']}, p95 {result['p95_us']})")
+    print("Самые медленные CVE:")
+    for cve_id, us in result['slowest']:
+        print(f"    {cve_id:<20} {us} мкс")
+    if result['checkers']:
+        print("Самые дорогие пакеты, мкс/CVE:")
+        for pkg_name, us in sorted(result['checkers'].items(), key=lambda item: -item[1])[:top]:
+            print(f"    {pkg_name:<20} {us}")
+
+
+def compare(result: dict, baseline: dict, threshold: float, checker_threshold=BENCH_CHECKER_THRESHOLD,
+            checker_floor=BENCH_CHECKER_FLOOR_US) -> (bool, list):
+    """
+    Сравнивает общее время проверки и время каждого пакета. Пакет считается замедлившимся, если стал дороже
+    на долю checker_threshold и при этом больше чем на checker_floor мкс: так новый медленный is_*_issue
+    не прячется в общем времени. Расхождения в вердиктах только печатаются - они ожидаемы при правке правил
+    :return: есть ли регрессия общего времени и список замедлившихся пакетов
+    """
+    regressed = result['per_cve_us'] > baseline['per_cve_us'] * (1 + threshold)
+    if regressed:
+        print(f"Регрессия (порог {threshold:.0%}): {result['per_cve_us']} мкс/CVE, baseline {baseline['per_cve_us']}")
+
+    regressions = []
+    for pkg_name, us in result['checkers'].items():
+        base_us = baseline.get('checkers', {}).get(pkg_name)
+        if base_us is None:
+            print(f"Новый пакет: {pkg_name} ({us} мкс/CVE)")
+        elif us - base_us > checker_floor and us > base_us * (1 + checker_threshold):
+            regressions.append(f"{pkg_name}: {us} мкс/CVE, baseline {base_us}")
+
+    if result['cves'] == baseline['cves']:
+        for pkg_name in sorted(set(result['verdicts']) | set(baseline['verdicts'])):
+            now, before = result['verdicts'].get(pkg_name, {}), baseline['verdicts'].get(pkg_name, {})
+            if now != before:
+                print(f"Вердикты изменились: {pkg_name}: {before} -> {now}")
+
+    return regressed, regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Бенчмарк проверки уязвимостей на принадлежность к пакетам по сохраненному корпусу nist"
+    )
+    parser.add_argument(
+        'corpus',
+        nargs='+',
+        help="Файлы (.json, .json.gz) с ответами NVD API 2.0 или папки с ними"
+    )
+    parser.add_argument(
+        '--rules',
+        type=str,
+        default=PKG_RULES_PATH,
+        help="Файл с правилами пакетов"
+    )
+    parser.add_argument(
+        '--baseline',
+        type=str,
+        default=BENCH_BASELINE_PATH,
+        help="Файл с сохраненными результатами для сравнения"
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help="Сохранить результаты как новый baseline"
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=BENCH_THRESHOLD,
+        help="Допустимое замедление относительно baseline, доля"
+    )
+    parser.add_argument(
+        '--checker-threshold',
+        type=float,
+        default=BENCH_CHECKER_THRESHOLD,
+        help="Допустимое замедление отдельного пакета относительно baseline, доля"
+    )
+    parser.add_argument(
+        '--checker-floor',
+        type=float,
+        default=BENCH_CHECKER_FLOOR_US,
+        help="Замедление пакета меньше этого (мкс/CVE) регрессией не считается"
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help="Число прогонов, берется лучшее время"
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=15,
+        help="Сколько самых дорогих пакетов выводить"
+    )
+    parser.add_argument(
+        '--no-per-checker',
+        dest='per_checker',
+        action='store_false',
+        help="Не замерять стоимость каждого пакета отдельно"
+    )
+
+    parser.set_defaults(save_baseline=False)
+    parser.set_defaults(per_checker=True)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments = parse_args()
+    corpus = load_corpus(arguments.corpus)
+    if not corpus:
+        print("Корпус пуст")
+        sys.exit(1)
+
+    matcher_mismatches = check_matcher(corpus, PkgHandler.load_pkg_rules(arguments.rules))
+    if matcher_mismatches:
+        print("Поиск по описанию расходится с перебором:")
+        for mismatch in matcher_mismatches:
+            print(f"    {mismatch}")
+        sys.exit(1)
+
+    bench_result = run_bench(corpus, PkgHandler.load_pkg_rules(arguments.rules),
+                             arguments.repeat, arguments.per_checker)
+    print_report(bench_result, arguments.top)
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, 'w') as f:
+            json.dump(bench_result, f, indent=4, ensure_ascii=False)
+        print(f"Baseline сохранен в {arguments.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(arguments.baseline):
+        print("Baseline не найден, сравнивать не с чем. Сохранить: --save-baseline")
+        sys.exit(0)
+
+    with open(arguments.baseline) as f:
+        bench_regressed, bench_regressions = compare(bench_result, json.load(f), arguments.threshold,
+                                                     arguments.checker_threshold, arguments.checker_floor)
+    if bench_regressions:
+        print(f"Замедлились пакеты (порог {arguments.checker_threshold:.0%}):")
+        for regression in bench_regressions:
+            print(f"    {regression}")
+    if bench_regressed or bench_regressions:
+        sys.exit(1)
+    print("Регрессии нет")
@@ -0,0 +1,331 @@
+import os
+import time
+import zlib
+import random
+import sqlite3
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from dotenv import dotenv_values
+
+# Get the path to the directory this file is in
+ENV_PATH = os.path.abspath(os.path.dirname(__file__))
+
+credentials = dotenv_values(f"{ENV_PATH}/.env")
+
+# Сохраненные ответы get_response
+HTTP_CACHE_PATH = f"{os.path.expanduser('.')}/http_cache.sqlite"
+# Сколько секунд ответ с хоста считается свежим и отдается без запроса. Потом запрос идет с If-None-Match /
+# If-Modified-Since, и если страница не менялась, сервер отвечает 304 без тела. Хосты не из списка не кэшируются
+HTTP_CACHE_TTL = {
+    'www.mozilla.org': 60 * 60,
+    'chromereleases.googleblog.com': 60 * 60,
+    'www.zerodayinitiative.com': 60 * 60,
+    # .patch коммита не меняется
+    'github.com': 30 * 24 * 60 * 60,
+    'access.redhat.com': 6 * 60 * 60,
+}
+# Предельный размер кэша (сжатых ответов) в байтах. Сверх него удаляются ответы, которые дольше всех не читались
+HTTP_CACHE_MAX_SIZE = 200 * 1024 * 1024
+# Сколько раз по умолчанию повторять запрос при ошибке соединения, таймауте или ответе из HTTP_RETRY_STATUSES
+HTTP_RETRIES = 3
+# Пауза перед первым повтором в секундах, дальше удваивается (со случайной поправкой), но не больше HTTP_BACKOFF_MAX.
+# Retry-After из ответа важнее
+HTTP_BACKOFF = 1
+HTTP_BACKOFF_MAX = 60
+# Таймаут по умолчанию (в секундах) на установку соединения и на каждое чтение из сокета, без него зависший сервер
+# держит запрос вечно
+HTTP_TIMEOUT = 60
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Методы, которые можно безопасно повторить. Остальные (POST) могли уже выполниться на сервере, даже если ответа
+# не было, поэтому повторяются только при 429 и если соединение так и не установилось
+HTTP_IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+# Сколько соединений с одним хостом держать открытыми (запросы к NIST идут в несколько потоков)
+HTTP_POOL_SIZE = 10
+# Ограничения запросов по хостам: (сколько запросов, за сколько секунд, сколько из них можно сделать подряд).
+# Запросы проходят через TokenBucket, так что ни в каком окне их не больше разрешенного. Хосты не из списка не ограничены
+HTTP_RATE_LIMITS = {
+    # NVD без ключа api: 5 запросов в скользящем окне 30 секунд
+    'services.nvd.nist.gov': (5, 30, 1),
+    # GitHub API без токена: 60 запросов в час
+    'api.github.com': (60, 60 * 60, 5),
+    # Telegram: не больше 20 сообщений в минуту в группу
+    'api.telegram.org': (20, 60, 1),
+    # у трекера явной квоты нет, просто не заваливаем его поиском
+    urlparse(credentials.get('REDMINE_URL', '')).netloc: (100, 10, 10),
+}
+# С ключом api в заголовке квота выше и считается на каждый ключ: {хост: (заголовок, ограничение)}
+HTTP_KEY_RATE_LIMITS = {
+    'services.nvd.nist.gov': ('apiKey', (50, 30, 5)),
+    'api.github.com': ('Authorization', (5000, 60 * 60, 100)),
+}
+# Хосты, которые при превышении квоты отвечают 403, а не 429
+HTTP_THROTTLE_403 = ('services.nvd.nist.gov', 'api.github.com')
+
+# requests.Session на каждый хост: соединения переиспользуются, а не открываются (TCP+TLS) на каждый запрос
+_sessions = {}
+_sessions_lock = threading.Lock()
+# TokenBucket на каждый хост (и ключ api)
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    Не больше limit запросов за любые window секунд, из них подряд - не больше burst. Потокобезопасен.
+    Если сервер ответил, что запросов слишком много, скорость падает вдвое и восстанавливается с каждым успешным запросом
+    """
+
+    def __init__(self, limit: int, window: float, burst=1):
+        # burst запросов сразу и еще (limit - burst) за окно как раз дают limit в любом окне
+        self.max_rate = self.rate = (limit - burst) / window
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Ждет, пока не появится свободный токен, и забирает его
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def throttle(self, delay=None):
+        """
+        Сервер ответил 429 (или 403 там, где так сообщают о квоте): останавливаем все запросы к нему на delay секунд
+        (по умолчанию - на время одного токена) и снижаем скорость
+        """
+        with self.lock:
+            self.rate = max(self.rate / 2, self.max_rate / 16)
+            self.tokens = 0
+            self.updated = time.monotonic()
+            self.paused_until = self.updated + (delay if delay is not None else 1 / self.rate)
+
+    def succeed(self):
+        with self.lock:
+            self.rate = min(self.rate + self.max_rate / 16, self.max_rate)
+
+
+def get_rate_limiter(url: str, headers=None):
+    """
+    :param headers: заголовки запроса, из них берется ключ api для хостов из HTTP_KEY_RATE_LIMITS
+    :return: TokenBucket для хоста из url или None, если хост не ограничен
+    """
+    host = urlparse(url).netloc
+    key_header, key_limit = HTTP_KEY_RATE_LIMITS.get(host, (None, None))
+    api_key = (headers or {}).get(key_header) if key_header else None
+    limit = key_limit if api_key else HTTP_RATE_LIMITS.get(host)
+    if not limit:
+        return None
+    with _limiters_lock:
+        if (host, api_key) not in _limiters:
+            _limiters[host, api_key] = TokenBucket(*limit)
+        return _limiters[host, api_key]
+
+
+def retry_after(response):
+    """
+    :return: сколько секунд просит подождать сервер в Retry-After или None
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitedSession(requests.Session):
+    """
+    Сессия, все запросы которой проходят через ограничитель своего хоста (get_rate_limiter)
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        limiter = get_rate_limiter(url, dict(self.headers, **(kwargs.get('headers') or {})))
+        if not limiter:
+            return super().request(method, url, *args, **kwargs)
+
+        limiter.acquire()
+        response = super().request(method, url, *args, **kwargs)
+        if response.status_code == 429 or (response.status_code == 403 and urlparse(url).netloc in HTTP_THROTTLE_403):
+            limiter.throttle(retry_after(response))
+        else:
+            limiter.succeed()
+        return response
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    :return: общая сессия для хоста из url
+    """
+    parsed = urlparse(url)
+    key = f"{parsed.scheme}://{parsed.netloc}"
+    with _sessions_lock:
+        if key not in _sessions:
+            session = RateLimitedSession()
+            session.mount(key, HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE))
+            _sessions[key] = session
+        return _sessions[key]
+
+
+def retry_delay(attempt: int, response=None) -> float:
+    """
+    :param attempt: номер повтора, с нуля
+    :param response: ответ, после которого повторяем, если он был
+    :return: пауза перед повтором в секундах
+    """
+    delay = retry_after(response) if response is not None else None
+    if delay is not None:
+        return delay
+    # случайная поправка, чтобы одновременные повторы не приходили к серверу разом
+    return min(HTTP_BACKOFF * 2 ** attempt, HTTP_BACKOFF_MAX) * random.uniform(0.5, 1)
+
+
+def http_request(method: str, url: str, retries=HTTP_RETRIES, **kwargs) -> requests.Response:
+    """
+    То же, что requests.request(method, url, **kwargs), но через сессию хоста (с ограничителем), с повторами
+    и таймаутом HTTP_TIMEOUT, если в kwargs не указан свой
+    :param retries: сколько раз повторять запрос при ошибке соединения, таймауте или ответе из HTTP_RETRY_STATUSES.
+    Запросы не из HTTP_IDEMPOTENT_METHODS повторяются только при 429 и таймауте установки соединения
+    :return: ответ. Если сервер так и не ответил, пробрасывается исключение последней попытки
+    """
+    if method.upper() in HTTP_IDEMPOTENT_METHODS:
+        retry_errors, retry_statuses = (requests.exceptions.ConnectionError, requests.exceptions.Timeout), \
+            HTTP_RETRY_STATUSES
+    else:
+        retry_errors, retry_statuses = requests.exceptions.ConnectTimeout, (429,)
+    kwargs.setdefault('timeout', HTTP_TIMEOUT)
+
+    for attempt in range(retries + 1):
+        try:
+            response = get_session(url).request(method, url, **kwargs)
+        except retry_errors:
+            if attempt == retries:
+                raise
+            time.sleep(retry_delay(attempt))
+            continue
+
+        if response.status_code not in retry_statuses or attempt == retries:
+            return response
+        # соединение возвращается в пул, только когда тело прочитано или ответ закрыт
+        response.close()
+        time.sleep(retry_delay(attempt, response))
+
+
+def http_get(url: str, retries=HTTP_RETRIES, **kwargs) -> requests.Response:
+    return http_request('GET', url, retries=retries, **kwargs)
+
+
+def http_post(url: str, retries=HTTP_RETRIES, **kwargs) -> requests.Response:
+    return http_request('POST', url, retries=retries, **kwargs)
+
+
+class HttpCache:
+    """
+    Кэш GET-ответов на диске: ответ хранится вместе с ETag/Last-Modified и по истечении срока свежести
+    перепроверяется условным запросом. Запросы с авторизацией и потоковые (скачивание архивов) не кэшируются
+    """
+
+    def __init__(self, path=HTTP_CACHE_PATH, ttls=None, max_size=HTTP_CACHE_MAX_SIZE):
+        """
+        :param path: путь к файлу базы
+        :param ttls: dict вида {хост: срок свежести в секундах}, по умолчанию HTTP_CACHE_TTL
+        :param max_size: предельный размер кэша в байтах
+        """
+        self.ttls = HTTP_CACHE_TTL if ttls is None else ttls
+        self.max_size = max_size
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS http_cache ("
+                          "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, encoding TEXT, content BLOB, "
+                          "size INTEGER, fetched REAL, used REAL)")
+        self.conn.commit()
+
+    @staticmethod
+    def __make_response(url: str, encoding, content: bytes) -> requests.Response:
+        response = requests.Response()
+        response.url = url
+        response.status_code = requests.codes.ok
+        response.encoding = encoding
+        # тело уже прочитано: iter_content и text берут его из _content
+        response._content = zlib.decompress(content)
+        response._content_consumed = True
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        То же, что http_get(url, **kwargs), но с кэшем
+        """
+        ttl = self.ttls.get(urlparse(url).netloc)
+        if ttl is None or kwargs.get('auth') or kwargs.get('stream'):
+            return http_get(url, **kwargs)
+
+        now = time.time()
+        row = self.conn.execute("SELECT etag, last_modified, encoding, content, fetched FROM http_cache "
+                                "WHERE url = ?", (url,)).fetchone()
+        if row and now - row[4] < ttl:
+            self.conn.execute("UPDATE http_cache SET used = ? WHERE url = ?", (now, url))
+            self.conn.commit()
+            return self.__make_response(url, row[2], row[3])
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if row and row[0]:
+            headers['If-None-Match'] = row[0]
+        if row and row[1]:
+            headers['If-Modified-Since'] = row[1]
+        try:
+            response = http_get(url, headers=headers, **kwargs)
+        except requests.exceptions.RequestException:
+            # сервер недоступен - лучше старая копия, чем ничего
+            if row:
+                return self.__make_response(url, row[2], row[3])
+            raise
+
+        if row and (response.status_code == requests.codes.not_modified or response.status_code >= 500):
+            self.conn.execute("UPDATE http_cache SET etag = ?, last_modified = ?, fetched = ?, used = ? WHERE url = ?",
+                              (response.headers.get('ETag', row[0]), response.headers.get('Last-Modified', row[1]),
+                               now if response.status_code == requests.codes.not_modified else row[4], now, url))
+            self.conn.commit()
+            return self.__make_response(url, row[2], row[3])
+
+        if response.status_code == requests.codes.ok:
+            self.put(url, response, now)
+        return response
+
+    def put(self, url: str, response: requests.Response, now: float):
+        content = zlib.compress(response.content)
+        if len(content) > self.max_size:
+            return
+        self.conn.execute("INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                          (url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                           response.encoding, content, len(content), now, now))
+        self.evict()
+        self.conn.commit()
+
+    def evict(self):
+        """
+        Удаляет ответы, которые дольше всех не читались, пока кэш не уложится в max_size
+        """
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_size:
+            return
+        for url, size in self.conn.execute("SELECT url, size FROM http_cache ORDER BY used").fetchall():
+            if total <= self.max_size:
+                break
+            self.conn.execute("DELETE FROM http_cache WHERE url = ?", (url,))
+            total -= size
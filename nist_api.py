@@ -0,0 +1,279 @@
+import re
+import json
+import time
+import codecs
+import requests
+from collections import deque
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from pkg_handlers import CPE_RANGE_FIELDS
+from http_client import HTTP_RETRY_STATUSES, get_session
+
+NIST_API_URL = "https://services.nvd.nist.gov/rest/json/cves/2.0"
+NIST_CVE = "cveId"
+NIST_REJ = "noRejected"
+NIST_START = "pubStartDate"
+NIST_END = "pubEndDate"
+NIST_LASTMOD_START = "lastModStartDate"
+NIST_LASTMOD_END = "lastModEndDate"
+NIST_START_INDEX = "startIndex"
+NIST_PER_PAGE = "resultsPerPage"
+# Больше записей на страницу NIST не отдает
+NIST_MAX_PER_PAGE = 2000
+# Больше 120 дней в окне дат NIST не принимает
+NIST_MAX_RANGE_DAYS = 120
+# Даты без смещения NIST считает временем UTC
+NIST_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.000"
+# Сколько раз повторять запрос, если NIST ответил кодом из NIST_RETRY_STATUSES или не ответил, и пауза перед первым
+# повтором (в секундах). Дальше пауза удваивается
+NIST_RETRIES = 5
+NIST_BACKOFF = 6
+NIST_TIMEOUT = 60
+# 403 NIST отдает при превышении квоты, 5xx - при перегрузке
+NIST_RETRY_STATUSES = frozenset(HTTP_RETRY_STATUSES) | {403}
+# Сколько страниц запрашивать одновременно
+NIST_PAGE_WORKERS = 4
+# Ответ NIST читается и разбирается кусками такого размера, целиком в памяти он не держится
+NIST_CHUNK_SIZE = 64 * 1024
+# Поля cpeMatch, которые остаются в записи после trim_cve
+NIST_CPE_MATCH_FIELDS = ('vulnerable', 'criteria') + CPE_RANGE_FIELDS
+
+
+def prepare_url(url, queries: dict) -> str:
+    """
+    собирает ссылку с требуемыми запросами
+    """
+    url += '?'
+    for k, v in queries.items():
+        url += f'{k}={v}' if v else k
+        url += '&'
+    return url[:-1]
+
+
+def lastmod_windows(date_from, date_to) -> list:
+    """
+    Разбивает период на окна lastModStartDate/lastModEndDate, которые примет NIST
+    :param date_from: datetime начала периода в UTC
+    :param date_to: datetime конца периода в UTC
+    :return: список параметров запроса
+    """
+    windows = []
+    while date_from < date_to:
+        window_end = min(date_from + timedelta(days=NIST_MAX_RANGE_DAYS), date_to)
+        windows.append({NIST_LASTMOD_START: date_from.strftime(NIST_DATE_FORMAT),
+                        NIST_LASTMOD_END: window_end.strftime(NIST_DATE_FORMAT)})
+        date_from = window_end
+
+    return windows
+
+
+def trim_cve(cve: dict) -> dict:
+    """
+    Оставляет в элементе vulnerabilities только то, что нужно для проверки и задач на трекере
+    (prepare_cve_input, get_cpe, get_patch_links, get_issue). Полная запись с историей ссылок,
+    всеми метриками и описаниями на всех языках в разы больше
+    """
+    data = cve['cve']
+    return {'cve': {
+        'id': data['id'],
+        'published': data.get('published'),
+        'lastModified': data.get('lastModified'),
+        'vulnStatus': data.get('vulnStatus'),
+        # используется только первое (английское) описание
+        'descriptions': data.get('descriptions', [])[:1],
+        'references': [{key: ref[key] for key in ('url', 'tags') if key in ref} for ref in data.get('references', [])],
+        # по каждой версии CVSS нужна только первая оценка
+        'metrics': {key: [{'cvssData': {field: metrics[0]['cvssData'].get(field) for field in ('version', 'baseScore')}}]
+                    for key, metrics in data.get('metrics', {}).items() if metrics},
+        'configurations': [{'nodes': [{'cpeMatch': [{field: cpe_match[field]
+                                                     for field in NIST_CPE_MATCH_FIELDS if field in cpe_match}
+                                                    for cpe_match in node.get('cpeMatch', [])]}
+                                      for node in configuration.get('nodes', [])]}
+                           for configuration in data.get('configurations', [])],
+    }}
+
+
+class JsonStream:
+    """
+    Чтение JSON по кускам текста: значения разбираются по одному, буфер хранит только неразобранный хвост
+    """
+
+    # конец числа или литерала: по куску "12" не понять, что это не начало "123"
+    scalar_end = re.compile(r'[\s,\]}]')
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+
+    def more(self) -> bool:
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        :return: следующий непробельный символ, не забирая его
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.more():
+                raise ValueError("Unexpected end of JSON")
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"Expected one of '{chars}', got '{char}'")
+        self.pos += 1
+        return char
+
+    def value(self):
+        if self.peek() not in '{["':
+            while not self.scalar_end.search(self.buffer, self.pos) and self.more():
+                pass
+        while True:
+            try:
+                value, self.pos = self.decoder.raw_decode(self.buffer, self.pos)
+                return value
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+
+
+def iter_vulnerabilities(chunks, header: dict):
+    """
+    Разбирает ответ NVD API по кускам текста, не собирая его целиком
+    :param chunks: куски текста ответа
+    :param header: сюда складываются остальные поля ответа (totalResults и т.п.)
+    :return: генератор элементов vulnerabilities по одному
+    """
+    stream = JsonStream(chunks)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key == 'vulnerabilities':
+            stream.expect('[')
+            if stream.peek() == ']':
+                stream.expect(']')
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.expect(',]') == ']':
+                        break
+        else:
+            header[key] = stream.value()
+        if stream.expect(',}') == '}':
+            return
+
+
+class NistClient:
+    """
+    Запросы к NVD API 2.0 и постраничная выгрузка в несколько потоков. Квоту ключа соблюдает сессия хоста
+    (http_client.HTTP_KEY_RATE_LIMITS), ограничитель у всех клиентов с одним ключом общий
+    """
+
+    def __init__(self, api_key=None, headers=None, workers=NIST_PAGE_WORKERS):
+        """
+        :param api_key: ключ api NIST. Без него квота в 10 раз меньше
+        :param headers: общие заголовки запросов
+        :param workers: сколько страниц запрашивать одновременно
+        """
+        self.headers = dict(headers or {}, **({'apiKey': api_key} if api_key else {}))
+        self.workers = max(workers, 1)
+
+    def get(self, params: dict):
+        """
+        Запрос к api с повторами: на 403 и 5xx NIST отвечает при превышении квоты или перегрузке
+        :return: ответ в виде dict или None, если получить его не удалось
+        """
+        url = prepare_url(NIST_API_URL, params)
+        for attempt in range(NIST_RETRIES + 1):
+            if attempt:
+                time.sleep(NIST_BACKOFF * 2 ** (attempt - 1))
+            try:
+                response = get_session(url).get(url, headers=self.headers, timeout=NIST_TIMEOUT, stream=True)
+            except requests.exceptions.RequestException:
+                continue
+            try:
+                if response.status_code == requests.codes.ok:
+                    return self.read(response)
+            except (requests.exceptions.RequestException, ValueError):
+                continue
+            finally:
+                # недочитанный (или оборванный) ответ держит соединение пула, пока его не закрыть
+                response.close()
+            if response.status_code not in NIST_RETRY_STATUSES:
+                return None
+
+        return None
+
+    @staticmethod
+    def read(response) -> dict:
+        """
+        Читает ответ по кускам и оставляет от записей только нужное (trim_cve)
+        :return: ответ в том же виде, что и response.json()
+        """
+        header, decoder = {}, codecs.getincrementaldecoder('utf-8')()
+        chunks = (decoder.decode(chunk) for chunk in response.iter_content(NIST_CHUNK_SIZE))
+        vulnerabilities = [trim_cve(cve) for cve in iter_vulnerabilities(chunks, header)]
+        return dict(header, vulnerabilities=vulnerabilities)
+
+    def get_many(self, params_list: list) -> list:
+        """
+        Несколько запросов в self.workers потоков, в пределах той же квоты
+        :return: ответы в том же порядке, None - если ответ получить не удалось
+        """
+        with ThreadPoolExecutor(self.workers) as executor:
+            return list(executor.map(self.get, params_list))
+
+    def get_page(self, params: dict, start_index: int):
+        return self.get(dict(params, **{NIST_PER_PAGE: str(NIST_MAX_PER_PAGE), NIST_START_INDEX: str(start_index)}))
+
+    def iter_pages(self, params: dict):
+        """
+        Постранично выгружает уязвимости, подходящие под params. Первая страница запрашивается сразу,
+        чтобы узнать totalResults, остальные - в self.workers потоков. Страницы отдаются по порядку,
+        вперед запрашивается не больше self.workers страниц
+        :return: генератор кортежей (totalResults, элементы vulnerabilities страницы).
+        Если NIST не ответил на первый запрос, не отдает ничего
+        """
+        nist_json = self.get_page(params, 0)
+        if not nist_json:
+            print("Can't get CVE from NIST")
+            return
+
+        # пустая страница тоже отдается: так видно, что NIST ответил, просто ничего не нашлось
+        total_res = nist_json['totalResults']
+        yield total_res, nist_json.get('vulnerabilities', [])
+        if not nist_json.get('vulnerabilities', ""):
+            return
+
+        # размер страницы берем по первой, а не NIST_MAX_PER_PAGE: если NIST отдаст меньше, ничего не пропустим
+        page_size = len(nist_json['vulnerabilities'])
+        start_indexes = deque(range(page_size, total_res, page_size))
+        with ThreadPoolExecutor(self.workers) as executor:
+            pending = deque()
+            while start_indexes or pending:
+                while start_indexes and len(pending) < self.workers:
+                    start_index = start_indexes.popleft()
+                    pending.append((start_index, executor.submit(self.get_page, params, start_index)))
+
+                start_index, future = pending.popleft()
+                nist_json = future.result()
+                if not nist_json or not nist_json.get('vulnerabilities', ""):
+                    print(f"Can't get CVE from NIST starting from {start_index}, the rest is skipped")
+                    for _, future in pending:
+                        future.cancel()
+                    return
+                yield total_res, nist_json['vulnerabilities']
@@ -0,0 +1,324 @@
+import os
+import io
+import gzip
+import json
+import time
+import zlib
+import sqlite3
+import zipfile
+from itertools import chain
+from datetime import datetime, timezone
+from dotenv import dotenv_values
+from pkg_handlers import IsXIssue
+from nist_api import NIST_DATE_FORMAT, NIST_CHUNK_SIZE, NistClient, lastmod_windows, iter_vulnerabilities, trim_cve
+
+# Get the path to the directory this file is in
+ENV_PATH = os.path.abspath(os.path.dirname(__file__))
+
+credentials = dotenv_values(f"{ENV_PATH}/.env")
+
+# Результаты разбора и проверки уязвимостей между запусками и сколько их хранить (в секундах)
+CVE_MEMO_PATH = f"{os.path.expanduser('.')}/cve_memo.sqlite"
+CVE_MEMO_TTL = int(credentials.get('CVE_MEMO_TTL') or 30 * 24 * 60 * 60)
+# Локальная копия базы NVD
+NVD_MIRROR_PATH = f"{os.path.expanduser('.')}/nvd_mirror.sqlite"
+# Сколько секунд после последней синхронизации записи копии считаются актуальными. Старше - уязвимости
+# спрашиваются у NIST (синхронизация - --sync-mirror, см. systemd/cbsr-sync-mirror.timer)
+NVD_MIRROR_MAX_AGE = int(credentials.get('NVD_MIRROR_MAX_AGE') or 2 * 24 * 60 * 60)
+# Метрики CVE JSON 5 и соответствующие им в NVD API 2.0
+CVE5_METRICS = {
+    'cvssV4_0': 'cvssMetricV40',
+    'cvssV3_1': 'cvssMetricV31',
+    'cvssV3_0': 'cvssMetricV30',
+    'cvssV2_0': 'cvssMetricV2',
+}
+
+
+def cve5_to_nvd(record: dict) -> dict:
+    """
+    Переводит запись CVE JSON 5 (cvelistV5) в вид элемента vulnerabilities NVD API 2.0.
+    CPE берутся из affected[].cpes, диапазонов версий в них нет
+    """
+    metadata = record['cveMetadata']
+    containers = [record['containers'].get('cna', {}), *record['containers'].get('adp', [])]
+    descriptions = containers[0].get('descriptions', [])
+    metrics = {}
+    for container in containers:
+        for metric in container.get('metrics', []):
+            for key, nvd_key in CVE5_METRICS.items():
+                if key in metric:
+                    metrics.setdefault(nvd_key, []).append({'cvssData': metric[key]})
+    cpe_matches = [{'vulnerable': True, 'criteria': cpe}
+                   for affected in containers[0].get('affected', []) for cpe in affected.get('cpes', [])]
+
+    return {'cve': {
+        'id': metadata['cveId'],
+        'published': metadata.get('datePublished'),
+        'lastModified': metadata.get('dateUpdated'),
+        'vulnStatus': metadata.get('state'),
+        # английское описание первым, как в NVD
+        'descriptions': sorted(descriptions, key=lambda description: not description.get('lang', '').startswith('en')),
+        'references': containers[0].get('references', []),
+        'metrics': metrics,
+        'configurations': [{'nodes': [{'cpeMatch': cpe_matches}]}] if cpe_matches else [],
+    }}
+
+
+def iter_feed_file(f, header=None) -> iter:
+    """
+    Разбирает открытый в текстовом режиме JSON: выгрузку NVD (nvdcve-2.0-*.json) или запись CVE JSON 5.
+    Из других файлов (не объект, объект без vulnerabilities и не CVE_RECORD) не отдает ничего
+    :param header: сюда складываются поля верхнего уровня, кроме vulnerabilities. Для не объекта остается пустым
+    :return: генератор кортежей (элемент vulnerabilities, взят ли он из выгрузки NVD)
+    """
+    header = {} if header is None else header
+    chunks = iter(lambda: f.read(NIST_CHUNK_SIZE), '')
+    first = next(chunks, '')
+    # в архивах бывают и служебные файлы, например массив cves/deltaLog.json в cvelistV5
+    if not first.lstrip().startswith('{'):
+        return
+    for cve in iter_vulnerabilities(chain([first], chunks), header):
+        yield cve, True
+    # в записи CVE JSON 5 нет vulnerabilities, вся она оказывается в header
+    if header.get('dataType') == 'CVE_RECORD' and header['cveMetadata'].get('state') != 'REJECTED':
+        yield cve5_to_nvd(header), False
+
+
+def iter_feed_records(paths: list) -> iter:
+    """
+    Читает локальные выгрузки уязвимостей по одной записи, распаковывая на лету:
+    выгрузки NVD 2.0 (.json, .json.gz, .zip) и архивы CVE JSON 5 (.zip с отдельным файлом на уязвимость)
+    :param paths: файлы или папки с ними
+    :return: генератор кортежей (элемент vulnerabilities в урезанном виде (trim_cve), взят ли он из выгрузки NVD).
+    Записи CVE JSON 5 - не NVD: в них нет CPE-диапазонов и анализа NVD
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(os.path.join(root, name) for root, _, names in os.walk(path) for name in names
+                                if name.endswith(('.json', '.json.gz', '.zip'))))
+        else:
+            files.append(path)
+
+    for file in files:
+        if file.endswith('.zip'):
+            with zipfile.ZipFile(file) as archive:
+                for name in archive.namelist():
+                    if not name.endswith('.json'):
+                        continue
+                    with archive.open(name) as member, io.TextIOWrapper(member, encoding='utf-8') as f:
+                        yield from read_feed_file(f, f"{file}:{name}")
+        else:
+            with (gzip.open if file.endswith('.gz') else open)(file, 'rt', encoding='utf-8') as f:
+                yield from read_feed_file(f, file)
+
+
+def read_feed_file(f, name: str) -> iter:
+    """
+    iter_feed_file с урезанием записей. Битый файл пропускается, чтобы не прерывать разбор остальных.
+    Об объекте, который не похож ни на выгрузку NVD 2.0, ни на CVE JSON 5 (например, выгрузка NVD 1.1
+    с CVE_Items), предупреждает: иначе такой файл молча дал бы 0 уязвимостей
+    :param name: имя файла для сообщений
+    """
+    header, count = {}, 0
+    try:
+        for cve, from_nvd in iter_feed_file(f, header):
+            count += 1
+            yield trim_cve(cve), from_nvd
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Can't read {name}, skipped: {e!r}")
+        return
+
+    # пустая выгрузка NVD (format: NVD_CVE) и отозванная запись CVE JSON 5 - не ошибка
+    if not count and header and header.get('format') != 'NVD_CVE' and header.get('dataType') != 'CVE_RECORD':
+        print(f"Unknown format of {name}, skipped. Top-level keys: {', '.join(header)}")
+
+
+class CveMemo:
+    """
+    Сохраненные между запусками результаты classify_all по каждой уязвимости: разобранная запись,
+    вердикты по пакетам, скачанные патчи и отметка о том, что задача по уязвимости уже есть на трекере.
+    Запись действительна, пока у уязвимости не поменялся lastModified. Вместе с ней хранятся отпечатки
+    правил пакетов (RuleEngine.fingerprints), так что после правки правила перепроверяются только
+    затронутые пакеты
+    """
+
+    def __init__(self, path=CVE_MEMO_PATH, ttl=CVE_MEMO_TTL, refresh=False):
+        """
+        :param path: путь к файлу базы
+        :param ttl: сколько хранить запись, к которой не обращались, в секундах
+        :param refresh: не читать сохраненные записи, а только перезаписывать их
+        """
+        self.refresh = refresh
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS cve_memo ("
+                          "id TEXT PRIMARY KEY, last_modified TEXT, fingerprints TEXT, record TEXT, updated REAL)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.execute("DELETE FROM cve_memo WHERE updated < ?", (time.time() - ttl,))
+        self.conn.commit()
+
+    @staticmethod
+    def __dump_record(record: dict) -> str:
+        return json.dumps(dict(record, verdicts={pkg_name: is_pkg.name for pkg_name, is_pkg in record['verdicts'].items()}),
+                          ensure_ascii=False)
+
+    @staticmethod
+    def __load_record(data: str) -> dict:
+        record = json.loads(data)
+        record['verdicts'] = {pkg_name: IsXIssue[is_pkg] for pkg_name, is_pkg in record['verdicts'].items()}
+        return record
+
+    def get_many(self, cve_ids) -> dict:
+        """
+        :return: dict вида {id: {'last_modified': ..., 'fingerprints': {...}, 'record': {...}}}
+        """
+        if self.refresh:
+            return {}
+        cve_ids = list(cve_ids)
+        result = {}
+        # ограничение sqlite на число параметров в запросе
+        for i in range(0, len(cve_ids), 500):
+            chunk = cve_ids[i:i + 500]
+            rows = self.conn.execute(f"SELECT id, last_modified, fingerprints, record FROM cve_memo "
+                                     f"WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+            for cve_id, last_modified, fingerprints, record in rows:
+                result[cve_id] = {
+                    'last_modified': last_modified,
+                    'fingerprints': json.loads(fingerprints),
+                    'record': self.__load_record(record),
+                }
+
+        return result
+
+    def put_many(self, vulnerabilities: list, records: list, fingerprints: dict):
+        """
+        :param vulnerabilities: элементы vulnerabilities из ответа nist
+        :param records: результаты classify_all для них в том же порядке
+        :param fingerprints: отпечатки правил, с которыми получены вердикты
+        """
+        now = time.time()
+        fingerprints = json.dumps(fingerprints)
+        self.conn.executemany("INSERT OR REPLACE INTO cve_memo VALUES (?, ?, ?, ?, ?)",
+                              [(cve['cve']['id'], cve['cve'].get('lastModified', ''), fingerprints,
+                                self.__dump_record(record), now)
+                               for cve, record in zip(vulnerabilities, records)])
+        self.conn.commit()
+
+    def get_state(self, key: str):
+        """
+        Состояние между запусками, например время последней проверки измененных уязвимостей
+        """
+        row = self.conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO state VALUES (?, ?)", (key, value))
+        self.conn.commit()
+
+    def mark_on_tracker(self, cve_id: str):
+        """
+        Запоминает, что задача по уязвимости заведена, чтобы больше не искать ее на трекере
+        """
+        row = self.conn.execute("SELECT record FROM cve_memo WHERE id = ?", (cve_id,)).fetchone()
+        if not row:
+            return
+        record = self.__load_record(row[0])
+        record['on_tracker'] = True
+        self.conn.execute("UPDATE cve_memo SET record = ? WHERE id = ?", (self.__dump_record(record), cve_id))
+        self.conn.commit()
+
+
+class NvdMirror:
+    """
+    Локальная копия записей NVD (элементы vulnerabilities из ответа NVD API 2.0), чтобы не запрашивать
+    уязвимости у NIST по одной. Обновляется sync: запрашиваются только записи, измененные с прошлой синхронизации
+    """
+
+    def __init__(self, path=NVD_MIRROR_PATH):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS cve (id TEXT PRIMARY KEY, last_modified TEXT, data BLOB)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.commit()
+
+    @property
+    def last_sync(self):
+        """
+        :return: время начала последней успешной синхронизации (UTC, в формате NVD) или None
+        """
+        row = self.conn.execute("SELECT value FROM sync_state WHERE key = 'last_sync'").fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, max_age=NVD_MIRROR_MAX_AGE) -> bool:
+        """
+        :return: синхронизировалась ли копия за последние max_age секунд. Без синхронизации в копии только
+        случайные снимки записей (например, только что опубликованных и еще не разобранных NVD)
+        """
+        if not self.last_sync:
+            return False
+        last_sync = datetime.strptime(self.last_sync, NIST_DATE_FORMAT)
+        return (datetime.now(timezone.utc).replace(tzinfo=None) - last_sync).total_seconds() < max_age
+
+    def get(self, cve_id: str):
+        """
+        :return: запись по уязвимости или None, если ее в копии нет
+        """
+        row = self.conn.execute("SELECT data FROM cve WHERE id = ?", (cve_id,)).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def get_many(self, cve_ids) -> dict:
+        """
+        :return: dict вида {id: запись} для уязвимостей, которые есть в копии
+        """
+        cve_ids = list(cve_ids)
+        result = {}
+        for i in range(0, len(cve_ids), 500):
+            chunk = cve_ids[i:i + 500]
+            rows = self.conn.execute(f"SELECT id, data FROM cve WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+            result.update((cve_id, json.loads(zlib.decompress(data))) for cve_id, data in rows)
+
+        return result
+
+    def put_many(self, vulnerabilities: list, newer_only=False):
+        """
+        :param newer_only: не заменять записи с тем же или более поздним lastModified. Для записей не из api,
+        например из старых выгрузок, которые не должны затирать свежие
+        """
+        # записи хранятся сжатыми: даже урезанная (trim_cve) база NVD занимает не один гигабайт
+        self.conn.executemany("INSERT INTO cve VALUES (?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                              "last_modified = excluded.last_modified, data = excluded.data"
+                              + (" WHERE excluded.last_modified > cve.last_modified" if newer_only else ""),
+                              [(cve['cve']['id'], cve['cve'].get('lastModified', ''),
+                                zlib.compress(json.dumps(cve).encode()))
+                               for cve in vulnerabilities])
+        self.conn.commit()
+
+    def sync(self, nist: NistClient) -> int:
+        """
+        Загружает записи, измененные с последней синхронизации, при первом запуске - всю базу.
+        Время синхронизации запоминается, только если все страницы получены
+        :return: число загруженных записей
+        """
+        sync_start = datetime.now(timezone.utc).replace(tzinfo=None)
+        if self.last_sync:
+            windows = lastmod_windows(datetime.strptime(self.last_sync, NIST_DATE_FORMAT), sync_start)
+        else:
+            windows = [{}]
+
+        count, complete = 0, True
+        for params in windows:
+            total_res, received = None, 0
+            for total_res, vulnerabilities in nist.iter_pages(params):
+                self.put_many(vulnerabilities)
+                received += len(vulnerabilities)
+            count += received
+            if total_res is None or received < total_res:
+                complete = False
+                break
+
+        if complete:
+            self.conn.execute("INSERT OR REPLACE INTO sync_state VALUES ('last_sync', ?)",
+                              (sync_start.strftime(NIST_DATE_FORMAT),))
+            self.conn.commit()
+        else:
+            print("NVD mirror sync is incomplete, the same period will be requested next time")
+        return count
@@ -1,11 +1,16 @@
 import os
 import re
 import json
+import time
 import koji
+import hashlib
+import inspect
+import sqlite3
+import multiprocessing
 from enum import Enum
 from random import choice
 import urllib.parse as parse
-from itertools import zip_longest
+from functools import lru_cache, total_ordering, cached_property
 from dotenv import dotenv_values
 
 # Get the path to the directory this file is in
@@ -14,6 +19,8 @@ ENV_PATH = os.path.abspath(os.path.dirname(__file__))
 credentials = dotenv_values(f"{ENV_PATH}/.env")
 
 USERS_LIST = f"{os.path.expanduser('.')}/users.json"
+# Описание обрабатываемых пакетов: правила проверки уязвимостей и данные для задач на трекере
+PKG_RULES_PATH = f"{ENV_PATH}/pkg_rules.json"
 TAG_LIST_ST7 = [
     "os73-updates",
     "os73-kernel",
@@ -24,6 +31,18 @@ TAG_LIST_ST8 = [
 ]
 KOJI7_URL = credentials['KOJI7_URL']
 KOJI8_URL = credentials['KOJI8_URL']
+# Сколько вызовов koji отправлять в одном multicall-запросе
+KOJI_MULTICALL_BATCH = 500
+# Локальный кэш ответов koji и время жизни записей в нем (в секундах)
+NVR_CACHE_PATH = f"{os.path.expanduser('.')}/nvr_cache.sqlite"
+NVR_CACHE_TTL = int(credentials.get('NVR_CACHE_TTL') or 4 * 60 * 60)
+# Сколько уязвимостей отдавать дочернему процессу за раз при классификации в несколько процессов
+CLASSIFY_CHUNK_SIZE = 64
+# Версия логики RuleEngine. Увеличивать при изменениях, меняющих вердикты при тех же правилах:
+# это сбросит сохраненные результаты проверки (CveMemo) по всем пакетам
+RULE_ENGINE_VERSION = 2
+# Поля правила, которые касаются только задач на трекере и на вердикты не влияют
+RULE_TRACKER_FIELDS = ('stapel_name', 'assignee', 'watchers', 'deep_search', 'check_patch')
 
 
 class PatchResult(Enum):
@@ -39,3125 +58,959 @@ class IsXIssue(Enum):
     YES = 3
 
 
-def compare_versions(ver_a: str, ver_b: str) -> bool:
-    """
-    Сравниватель версий по старшинству. Нормально обрабатывает буквенные версии
-    """
-    def replace_chars_with_ord(ver_str: str) -> str:
-        result_str = ""
-        for char in ver_str:
-            if char == '~':
-                result_str += '.'
-                continue
-            result_str += str(ord(char)) if char.isalpha() else char
-        return result_str
-
-    ver_a_list = list(map(int, replace_chars_with_ord(ver_a).split('.')))
-    ver_b_list = list(map(int, replace_chars_with_ord(ver_b).split('.')))
-
-    for a, b in zip_longest(ver_a_list, ver_b_list, fillvalue=0):
-        if a > b:
-            return True
-        elif b > a:
-            return False
-    return True
-
-
-def ver_max(ver_list: list) -> str:
-    max_atm = "0"
-    for ver in ver_list:
-        if compare_versions(ver, max_atm):
-            max_atm = ver
-    return max_atm
-
-
-def split_and_strip(string: str) -> list:
-    return re.sub(r'[^\w\s]', ' ', string).split()
-
-
-class PkgHandler:
-
-    @staticmethod
-    def get_latest_rpm_data(package_name, tag_name, session, deep=True) -> dict:
-        """
-        На входе получает имя пакета, на выходе отдает dict с информацией по нему
-        :param package_name: Имя пакета
-        :param tag_name: Тег, в котором проверяем
-        :param session: объект сессии koji
-        :param deep: Флаг, какую логику использовать для поиска последнего пакета.
-        В случае False будет брать последней по дате, что может быть не слишком удачным выбором
-        :return: dict с инфой по пакету в случае успеха, пустой dict в противном случае
-        """
-        if deep:
-            package_list_raw = session.listTagged(tag_name['id'], package=package_name)
-            if not package_list_raw:
-                # на случай если не нашли в теге, ищем через наследование по простому
-                package_list = session.getLatestRPMS(tag_name['id'], arch='src', package=package_name)[1]
-                return package_list[0] if package_list else {}
-
-            # выделим старшую эпоху
-            epoch_list = [i['epoch'] for i in package_list_raw if i['epoch']]
-            latest_epoch = max(epoch_list) if epoch_list else None
-            latest_rpms = list(
-                filter(lambda x: x['epoch'] == latest_epoch, package_list_raw)) \
-                if latest_epoch else package_list_raw
-            # старшую версию
-            latest_version = ver_max([i['version'] for i in latest_rpms])
-            latest_rpms = list(filter(lambda x: x['version'] == latest_version, latest_rpms))
-            # и старший релиз
-            latest_release = ver_max([i['release'].split('.')[0] for i in latest_rpms])
-            package_list = list(filter(lambda x: x['release'].split('.')[0] == latest_release, latest_rpms))
-        else:
-            package_list = session.getLatestRPMS(tag_name['id'], arch='src', package=package_name)[1]
-
-        return package_list[0] if package_list else {}
-
-    def __init__(self):
-
-        with open(USERS_LIST) as f:
-            self.users_dict = json.loads(f.read())
-
-        self.session_st7 = koji.ClientSession(KOJI7_URL)
-        self.session_st8 = koji.ClientSession(KOJI8_URL)
-
-        self.tags = [(self.session_st7.getTag(tag), self.session_st7) for tag in TAG_LIST_ST7]
-        self.tags.extend([(self.session_st8.getTag(tag), self.session_st8) for tag in TAG_LIST_ST8])
-
-        self.pkgs_data = {
-            'kernel': {
-                'check_func': self.is_kernel_issue,
-                'cve_counter': 0,
-                'stapel_name': 'kernel-lt',
-                'nvr_list': [self.get_latest_rpm_data("kernel-lt", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': True,
-                'assigned_to': int(self.users_dict['artem.chernyshev']),
-                'watchers': [int(self.users_dict['artem.chernyshev'])],
-            },
-            'Vim': {
-                'check_func': self.is_vim_issue,
-                'cve_counter': 0,
-                'stapel_name': 'vim',
-                'nvr_list': [self.get_latest_rpm_data("vim", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'nextcloud': {
-                'check_func': self.is_nextcloud_generic_issue,
-                'cve_counter': 0,
-                'stapel_name': 'nextcloud',
-                'nvr_list': [self.get_latest_rpm_data("nextcloud", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'nextcloud-server': {
-                'check_func': self.is_nextcloud_server_issue,
-                'cve_counter': 0,
-                'stapel_name': 'nextcloud',
-                'nvr_list': [self.get_latest_rpm_data("nextcloud", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'nextcloud-mail': {
-                'check_func': self.is_nextcloud_mail_issue,
-                'cve_counter': 0,
-                'stapel_name': 'nextcloud-app-mail',
-                'nvr_list': [self.get_latest_rpm_data("nextcloud-app-mail", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'nextcloud-calendar': {
-                'check_func': self.is_nextcloud_calendar_issue,
-                'cve_counter': 0,
-                'stapel_name': 'nextcloud-app-calendar',
-                'nvr_list': [self.get_latest_rpm_data("nextcloud-app-calendar", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'nextcloud-contacts': {
-                'check_func': self.is_nextcloud_contacts_issue,
-                'cve_counter': 0,
-                'stapel_name': 'nextcloud-app-contacts',
-                'nvr_list': [self.get_latest_rpm_data("nextcloud-app-contacts", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'gpac': {
-                'check_func': self.is_gpac_issue,
-                'cve_counter': 0,
-                'stapel_name': 'gpac',
-                'nvr_list': [self.get_latest_rpm_data("gpac", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': None,
-            },
-            'redis': {
-                'check_func': self.is_redis_issue,
-                'cve_counter': 0,
-                'stapel_name': 'redis',
-                'nvr_list': [self.get_latest_rpm_data("redis", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'systemd': {
-                'check_func': self.is_systemd_issue,
-                'cve_counter': 0,
-                'stapel_name': 'systemd',
-                'nvr_list': [self.get_latest_rpm_data("systemd", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladimir.chirkin']),
-                'watchers': None,
-            },
-            'django': {
-                'check_func': self.is_django_issue,
-                'cve_counter': 0,
-                'stapel_name': 'python-django',
-                'nvr_list': [self.get_latest_rpm_data("python-django", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': choice([int(self.users_dict['vitaly.peshcherov']),
-                                       int(self.users_dict['ilia.polyvyanyy'])]),
-                'watchers': None,
-            },
-            'moodle': {
-                'check_func': self.is_moodle_issue,
-                'cve_counter': 0,
-                'stapel_name': 'moodle',
-                'nvr_list': [self.get_latest_rpm_data("moodle", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'Firefox': {
-                'check_func': self.is_firefox_issue,
-                'cve_counter': 0,
-                'stapel_name': 'firefox',
-                'nvr_list': [self.get_latest_rpm_data("firefox", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': [int(self.users_dict['oleg.shaposhnikov'])],
-            },
-            'Thunderbird': {
-                'check_func': self.is_thunderbird_issue,
-                'cve_counter': 0,
-                'stapel_name': 'thunderbird',
-                'nvr_list': [self.get_latest_rpm_data("thunderbird", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': [int(self.users_dict['oleg.shaposhnikov'])],
-            },
-            'cURL': {
-                'check_func': self.is_curl_issue,
-                'cve_counter': 0,
-                'stapel_name': 'curl',
-                'nvr_list': [self.get_latest_rpm_data("curl", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['yaroslav.kokurin']),
-                'watchers': None,
-            },
-            'glpi': {
-                'check_func': self.is_glpi_issue,
-                'cve_counter': 0,
-                'stapel_name': 'glpi',
-                'nvr_list': [self.get_latest_rpm_data("glpi", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': None,
-            },
-            'libtiff': {
-                'check_func': self.is_libtiff_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libtiff',
-                'nvr_list': [self.get_latest_rpm_data("libtiff", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'grafana': {
-                'check_func': self.is_grafana_issue,
-                'cve_counter': 0,
-                'stapel_name': 'grafana',
-                'nvr_list': [self.get_latest_rpm_data("grafana", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vitaly.peshcherov']),
-                'watchers': None,
-            },
-            'ImageMagick': {
-                'check_func': self.is_imagemagick_issue,
-                'cve_counter': 0,
-                'stapel_name': 'ImageMagick',
-                'nvr_list': [self.get_latest_rpm_data("ImageMagick", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'qemu': {
-                'check_func': self.is_qemu_issue,
-                'cve_counter': 0,
-                'stapel_name': 'qemu',
-                'nvr_list': [self.get_latest_rpm_data("qemu", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['oleg.sviridov']),
-                'watchers': None,
-            },
-            'Wireshark': {
-                'check_func': self.is_wireshark_issue,
-                'cve_counter': 0,
-                'stapel_name': 'wireshark',
-                'nvr_list': [self.get_latest_rpm_data("wireshark", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['oleg.sviridov']),
-                'watchers': None,
-            },
-            'libvirt': {
-                'check_func': self.is_libvirt_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libvirt',
-                'nvr_list': [self.get_latest_rpm_data("libvirt", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': choice([int(self.users_dict['vitaly.peshcherov']),
-                                       int(self.users_dict['dmitry.safonov'])]),
-                'watchers': None,
-            },
-            'libraw': {
-                'check_func': self.is_libraw_issue,
-                'cve_counter': 0,
-                'stapel_name': 'LibRaw',
-                'nvr_list': [self.get_latest_rpm_data("LibRaw", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'samba': {
-                'check_func': self.is_samba_issue,
-                'cve_counter': 0,
-                'stapel_name': 'samba',
-                'nvr_list': [self.get_latest_rpm_data("samba", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['dmitry.safonov']),
-                'watchers': None,
-            },
-            'openSSL': {
-                'check_func': self.is_openssl_issue,
-                'cve_counter': 0,
-                'stapel_name': 'openssl',
-                'nvr_list': [self.get_latest_rpm_data("openssl", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': None,
-            },
-            'yasm': {
-                'check_func': self.is_yasm_issue,
-                'cve_counter': 0,
-                'stapel_name': 'yasm',
-                'nvr_list': [self.get_latest_rpm_data("yasm", tag[0], tag[1], deep=False).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'Emacs': {
-                'check_func': self.is_emacs_issue,
-                'cve_counter': 0,
-                'stapel_name': 'emacs',
-                'nvr_list': [self.get_latest_rpm_data("emacs", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['maxim.noskov']),
-                'watchers': None,
-            },
-            'libreswan': {
-                'check_func': self.is_libreswan_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libreswan',
-                'nvr_list': [self.get_latest_rpm_data("libreswan", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['oleg.sviridov']),
-                'watchers': None,
-            },
-            'libreoffice': {
-                'check_func': self.is_libreoffice_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libreoffice',
-                'nvr_list': [self.get_latest_rpm_data("libreoffice", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'sudo': {
-                'check_func': self.is_sudo_issue,
-                'cve_counter': 0,
-                'stapel_name': 'sudo',
-                'nvr_list': [self.get_latest_rpm_data("sudo", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'podofo': {
-                'check_func': self.is_podofo_issue,
-                'cve_counter': 0,
-                'stapel_name': 'podofo',
-                'nvr_list': [self.get_latest_rpm_data("podofo", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'opensearch': {
-                'check_func': self.is_opensearch_issue,
-                'cve_counter': 0,
-                'stapel_name': 'opensearch',
-                'nvr_list': [self.get_latest_rpm_data("opensearch", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'libheif': {
-                'check_func': self.is_libheif_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libheif',
-                'nvr_list': [self.get_latest_rpm_data("libheif", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'flask': {
-                'check_func': self.is_flask_issue,
-                'cve_counter': 0,
-                'stapel_name': 'python-flask',
-                'nvr_list': [self.get_latest_rpm_data("python-flask", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'cups-filters': {
-                'check_func': self.is_cups_filters_issue,
-                'cve_counter': 0,
-                'stapel_name': 'cups-filters',
-                'nvr_list': [self.get_latest_rpm_data("cups-filters", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'CUPS': {
-                'check_func': self.is_cups_issue,
-                'cve_counter': 0,
-                'stapel_name': 'cups',
-                'nvr_list': [self.get_latest_rpm_data("cups", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'Lua': {
-                'check_func': self.is_lua_issue,
-                'cve_counter': 0,
-                'stapel_name': 'lua',
-                'nvr_list': [self.get_latest_rpm_data("lua", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladimir.chirkin']),
-                'watchers': None,
-            },
-            'nginx': {
-                'check_func': self.is_nginx_issue,
-                'cve_counter': 0,
-                'stapel_name': 'nginx',
-                'nvr_list': [self.get_latest_rpm_data("nginx", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': None,
-            },
-            'tcpdump': {
-                'check_func': self.is_tcpdump_issue,
-                'cve_counter': 0,
-                'stapel_name': 'tcpdump',
-                'nvr_list': [self.get_latest_rpm_data("tcpdump", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': choice([int(self.users_dict['vitaly.peshcherov']),
-                                       int(self.users_dict['alexey.rodionov'])]),
-                'watchers': None,
-            },
-            'tmux': {
-                'check_func': self.is_tmux_issue,
-                'cve_counter': 0,
-                'stapel_name': 'tmux',
-                'nvr_list': [self.get_latest_rpm_data("tmux", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['artem.chernyshev']),
-                'watchers': None,
-            },
-            'flatpak': {
-                'check_func': self.is_flatpak_issue,
-                'cve_counter': 0,
-                'stapel_name': 'flatpak',
-                'nvr_list': [self.get_latest_rpm_data("flatpak", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': None,
-            },
-            'runc': {
-                'check_func': self.is_runc_issue,
-                'cve_counter': 0,
-                'stapel_name': 'runc',
-                'nvr_list': [self.get_latest_rpm_data("runc", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vadim.karyaev']),
-                'watchers': None,
-            },
-            'Kubernetes': {
-                'check_func': self.is_kubernetes_issue,
-                'cve_counter': 0,
-                'stapel_name': 'kubernetes',
-                'nvr_list': [self.get_latest_rpm_data("kubernetes", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vadim.karyaev']),
-                'watchers': None,
-            },
-            'Docker': {
-                'check_func': self.is_moby_issue,
-                'cve_counter': 0,
-                'stapel_name': 'docker-ce',
-                'nvr_list': [self.get_latest_rpm_data("docker-ce", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vadim.karyaev']),
-                'watchers': None,
-            },
-            'libssh': {
-                'check_func': self.is_libssh_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libssh',
-                'nvr_list': [self.get_latest_rpm_data("libssh", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['pavel.levin']),
-                'watchers': None,
-            },
-            'c-ares': {
-                'check_func': self.is_c_ares_issue,
-                'cve_counter': 0,
-                'stapel_name': 'c-ares',
-                'nvr_list': [self.get_latest_rpm_data("c-ares", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': choice([int(self.users_dict['vitaly.peshcherov']),
-                                       int(self.users_dict['vladislav.mitin']),
-                                       int(self.users_dict['ilia.polyvyanyy']),
-                                       ]),
-                'watchers': None,
-            },
-            'Avahi': {
-                'check_func': self.is_avahi_issue,
-                'cve_counter': 0,
-                'stapel_name': 'avahi',
-                'nvr_list': [self.get_latest_rpm_data("avahi", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': choice([int(self.users_dict['vitaly.peshcherov']),
-                                       int(self.users_dict['alexey.rodionov'])]),
-                'watchers': None,
-            },
-            'openSC': {
-                'check_func': self.is_opensc_issue,
-                'cve_counter': 0,
-                'stapel_name': 'opensc',
-                'nvr_list': [self.get_latest_rpm_data("opensc", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vitaly.peshcherov']),
-                'watchers': None,
-            },
-            'gRPC': {
-                'check_func': self.is_grpc_issue,
-                'cve_counter': 0,
-                'stapel_name': 'grpc',
-                'nvr_list': [self.get_latest_rpm_data("grpc", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': choice([int(self.users_dict['ilia.polyvyanyy']),
-                                       int(self.users_dict['dmitry.safonov'])]),
-                'watchers': None,
-            },
-            'libexpat': {
-                'check_func': self.is_libexpat_issue,
-                'cve_counter': 0,
-                'stapel_name': 'expat',
-                'nvr_list': [self.get_latest_rpm_data("expat", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': choice([int(self.users_dict['ilia.polyvyanyy']),
-                                       int(self.users_dict['alexey.rodionov'])]),
-                'watchers': None,
-            },
-            'libjxl': {
-                'check_func': self.is_libjxl_issue,
-                'cve_counter': 0,
-                'stapel_name': 'jpegxl',
-                'nvr_list': [self.get_latest_rpm_data("jpegxl", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'openldap': {
-                'check_func': self.is_openldap_issue,
-                'cve_counter': 0,
-                'stapel_name': 'openldap',
-                'nvr_list': [self.get_latest_rpm_data("openldap", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['pavel.levin']),
-                'watchers': None,
-            },
-            'Netty': {
-                'check_func': self.is_netty_issue,
-                'cve_counter': 0,
-                'stapel_name': 'netty',
-                'nvr_list': [self.get_latest_rpm_data("netty", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'Nettle': {
-                'check_func': self.is_nettle_issue,
-                'cve_counter': 0,
-                'stapel_name': 'nettle',
-                'nvr_list': [self.get_latest_rpm_data("nettle", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'pyPdf': {
-                'check_func': self.is_pypdf_issue,
-                'cve_counter': 0,
-                'stapel_name': 'pyPdf',
-                'nvr_list': [self.get_latest_rpm_data("pyPdf", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'Gradle': {
-                'check_func': self.is_gradle_issue,
-                'cve_counter': 0,
-                'stapel_name': 'gradle',
-                'nvr_list': [self.get_latest_rpm_data("gradle", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['yaroslav.kokurin']),
-                'watchers': None,
-            },
-            'Ghostscript': {
-                'check_func': self.is_ghostscript_issue,
-                'cve_counter': 0,
-                'stapel_name': 'ghostscript',
-                'nvr_list': [self.get_latest_rpm_data("ghostscript", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'pygments': {
-                'check_func': self.is_pygments_issue,
-                'cve_counter': 0,
-                'stapel_name': 'python-pygments',
-                'nvr_list': [self.get_latest_rpm_data("python-pygments", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'cargo': {
-                'check_func': self.is_cargo_issue,
-                'cve_counter': 0,
-                'stapel_name': 'rust',
-                'nvr_list': [self.get_latest_rpm_data("rust", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'rust': {
-                'check_func': self.is_rust_issue,
-                'cve_counter': 0,
-                'stapel_name': 'rust',
-                'nvr_list': [self.get_latest_rpm_data("rust", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'unRAR': {
-                'check_func': self.is_unrar_issue,
-                'cve_counter': 0,
-                'stapel_name': 'unrar',
-                'nvr_list': [self.get_latest_rpm_data("unrar", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'OpenDKIM': {
-                'check_func': self.is_opendkim_issue,
-                'cve_counter': 0,
-                'stapel_name': 'opendkim',
-                'nvr_list': [self.get_latest_rpm_data("opendkim", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['dmitry.safonov']),
-                'watchers': None,
-            },
-            'HAProxy': {
-                'check_func': self.is_haproxy_issue,
-                'cve_counter': 0,
-                'stapel_name': 'haproxy',
-                'nvr_list': [self.get_latest_rpm_data("haproxy", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['yaroslav.kokurin']),
-                'watchers': None,
-            },
-            'GitPython': {
-                'check_func': self.is_gitpython_issue,
-                'cve_counter': 0,
-                'stapel_name': 'GitPython',
-                'nvr_list': [self.get_latest_rpm_data("GitPython", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'djvulibre': {
-                'check_func': self.is_djvulibre_issue,
-                'cve_counter': 0,
-                'stapel_name': 'djvulibre',
-                'nvr_list': [self.get_latest_rpm_data("djvulibre", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'nasm': {
-                'check_func': self.is_nasm_issue,
-                'cve_counter': 0,
-                'stapel_name': 'nasm',
-                'nvr_list': [self.get_latest_rpm_data("nasm", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['pavel.levin']),
-                'watchers': None,
-            },
-            'Poppler': {
-                'check_func': self.is_poppler_issue,
-                'cve_counter': 0,
-                'stapel_name': 'poppler',
-                'nvr_list': [self.get_latest_rpm_data("poppler", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'p7zip': {
-                'check_func': self.is_p7zip_issue,
-                'cve_counter': 0,
-                'stapel_name': 'p7zip',
-                'nvr_list': [self.get_latest_rpm_data("p7zip", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'Alertmanager': {
-                'check_func': self.is_alertmanager_issue,
-                'cve_counter': 0,
-                'stapel_name': 'golang-github-prometheus-alertmanager',
-                'nvr_list': [self.get_latest_rpm_data("golang-github-prometheus-alertmanager",
-                                                      tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['dmitry.safonov']),
-                'watchers': None,
-            },
-            'giflib': {
-                'check_func': self.is_giflib_issue,
-                'cve_counter': 0,
-                'stapel_name': 'giflib',
-                'nvr_list': [self.get_latest_rpm_data("giflib", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'Salt': {
-                'check_func': self.is_salt_issue,
-                'cve_counter': 0,
-                'stapel_name': 'salt',
-                'nvr_list': [self.get_latest_rpm_data("salt", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['denis.karpov']),
-                'watchers': None,
-            },
-            'Ruby': {
-                'check_func': self.is_ruby_issue,
-                'cve_counter': 0,
-                'stapel_name': 'ruby',
-                'nvr_list': [self.get_latest_rpm_data("ruby", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladimir.chirkin']),
-                'watchers': None,
-            },
-            'Jenkins': {
-                'check_func': self.is_jenkins_issue,
-                'cve_counter': 0,
-                'stapel_name': 'jenkins',
-                'nvr_list': [self.get_latest_rpm_data("jenkins", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'ReportLab': {
-                'check_func': self.is_reportlab_issue,
-                'cve_counter': 0,
-                'stapel_name': 'python-reportlab',
-                'nvr_list': [self.get_latest_rpm_data("python-reportlab", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'Webmin': {
-                'check_func': self.is_webmin_issue,
-                'cve_counter': 0,
-                'stapel_name': 'webmin',
-                'nvr_list': [self.get_latest_rpm_data("webmin", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': None,
-            },
-            'Roundcube': {
-                'check_func': self.is_roundcube_issue,
-                'cve_counter': 0,
-                'stapel_name': 'roundcubemail',
-                'nvr_list': [self.get_latest_rpm_data("roundcubemail", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'GNOME-Shell': {
-                'check_func': self.is_gnome_shell_issue,
-                'cve_counter': 0,
-                'stapel_name': 'gnome-shell',
-                'nvr_list': [self.get_latest_rpm_data("gnome-shell", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladimir.chirkin']),
-                'watchers': None,
-            },
-            'libwebp': {
-                'check_func': self.is_libwebp_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libwebp',
-                'nvr_list': [self.get_latest_rpm_data("libwebp", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'snappy-java': {
-                'check_func': self.is_snappy_java_issue,
-                'cve_counter': 0,
-                'stapel_name': 'snappy-java',
-                'nvr_list': [self.get_latest_rpm_data("snappy-java", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['maxim.noskov']),
-                'watchers': None,
-            },
-            'composer': {
-                'check_func': self.is_composer_issue,
-                'cve_counter': 0,
-                'stapel_name': 'composer',
-                'nvr_list': [self.get_latest_rpm_data("composer", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vitaly.peshcherov']),
-                'watchers': None,
-            },
-            'OptiPNG': {
-                'check_func': self.is_optipng_issue,
-                'cve_counter': 0,
-                'stapel_name': 'optipng',
-                'nvr_list': [self.get_latest_rpm_data("optipng", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['yaroslav.kokurin']),
-                'watchers': None,
-            },
-            'Jetty': {
-                'check_func': self.is_jetty_issue,
-                'cve_counter': 0,
-                'stapel_name': 'jetty',
-                'nvr_list': [self.get_latest_rpm_data("jetty", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['maxim.noskov']),
-                'watchers': None,
-            },
-            'mosquitto': {
-                'check_func': self.is_mosquitto_issue,
-                'cve_counter': 0,
-                'stapel_name': 'mosquitto',
-                'nvr_list': [self.get_latest_rpm_data("mosquitto", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vitaly.peshcherov']),
-                'watchers': None,
-            },
-            'Vorbis-tools': {
-                'check_func': self.is_vorbis_tools_issue,
-                'cve_counter': 0,
-                'stapel_name': 'vorbis-tools',
-                'nvr_list': [self.get_latest_rpm_data("vorbis-tools", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['yaroslav.kokurin']),
-                'watchers': None,
-            },
-            'Codium': {
-                'check_func': self.is_codium_issue,
-                'cve_counter': 0,
-                'stapel_name': 'codium',
-                'nvr_list': [self.get_latest_rpm_data("codium", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vadim.karyaev']),
-                'watchers': None,
-            },
-            'Erlang': {
-                'check_func': self.is_erlang_issue,
-                'cve_counter': 0,
-                'stapel_name': 'erlang',
-                'nvr_list': [self.get_latest_rpm_data("erlang", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladlen.murylyov']),
-                'watchers': None,
-            },
-            'Chromium': {
-                'check_func': self.is_chromium_issue,
-                'cve_counter': 0,
-                'stapel_name': 'chromium',
-                'nvr_list': [self.get_latest_rpm_data("chromium", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['oleg.sviridov']),
-                'watchers': None,
-            },
-            'ffmpeg': {
-                'check_func': self.is_ffmpeg_issue,
-                'cve_counter': 0,
-                'stapel_name': 'ffmpeg',
-                'nvr_list': [self.get_latest_rpm_data("ffmpeg", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'golang': {
-                'check_func': self.is_golang_issue,
-                'cve_counter': 0,
-                'stapel_name': 'golang',
-                'nvr_list': [self.get_latest_rpm_data("golang", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vadim.karyaev']),
-                'watchers': None,
-            },
-            'cri-o': {
-                'check_func': self.is_cri_o_issue,
-                'cve_counter': 0,
-                'stapel_name': 'cri-o',
-                'nvr_list': [self.get_latest_rpm_data("cri-o", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vadim.karyaev']),
-                'watchers': None,
-            },
-            'libde265': {
-                'check_func': self.is_libde265_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libde265',
-                'nvr_list': [self.get_latest_rpm_data("libde265", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'openssh': {
-                'check_func': self.is_openssh_issue,
-                'cve_counter': 0,
-                'stapel_name': 'openssh',
-                'nvr_list': [self.get_latest_rpm_data("openssh", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['oleg.sviridov']),
-                'watchers': None,
-            },
-            'openvpn': {
-                'check_func': self.is_openvpn_issue,
-                'cve_counter': 0,
-                'stapel_name': 'openvpn',
-                'nvr_list': [self.get_latest_rpm_data("openvpn", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['oleg.sviridov']),
-                'watchers': None,
-            },
-            'openvswitch': {
-                'check_func': self.is_openvswitch_issue,
-                'cve_counter': 0,
-                'stapel_name': 'openvswitch',
-                'nvr_list': [self.get_latest_rpm_data("openvswitch", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'FreeRDP': {
-                'check_func': self.is_freerdp_issue,
-                'cve_counter': 0,
-                'stapel_name': 'freerdp',
-                'nvr_list': [self.get_latest_rpm_data("freerdp", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'Clojure': {
-                'check_func': self.is_clojure_issue,
-                'cve_counter': 0,
-                'stapel_name': 'clojure',
-                'nvr_list': [self.get_latest_rpm_data("clojure", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vitaly.peshcherov']),
-                'watchers': None,
-            },
-            'FreeIPA': {
-                'check_func': self.is_freeipa_issue,
-                'cve_counter': 0,
-                'stapel_name': 'freeipa',
-                'nvr_list': [self.get_latest_rpm_data("freeipa", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'Kate': {
-                'check_func': self.is_kate_issue,
-                'cve_counter': 0,
-                'stapel_name': 'kate',
-                'nvr_list': [self.get_latest_rpm_data("kate", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladimir.chirkin']),
-                'watchers': None,
-            },
-            'Atril': {
-                'check_func': self.is_atril_issue,
-                'cve_counter': 0,
-                'stapel_name': 'atril',
-                'nvr_list': [self.get_latest_rpm_data("atril", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'TinyXML': {
-                'check_func': self.is_tinyxml_issue,
-                'cve_counter': 0,
-                'stapel_name': 'tinyxml',
-                'nvr_list': [self.get_latest_rpm_data("tinyxml", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['pavel.levin']),
-                'watchers': None,
-            },
-            'Apache': {
-                'check_func': self.is_apache_issue,
-                'cve_counter': 0,
-                'stapel_name': 'httpd',
-                'nvr_list': [self.get_latest_rpm_data("httpd", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilia.polyvyanyy']),
-                'watchers': None,
-            },
-            'urllib3': {
-                'check_func': self.is_urllib3_issue,
-                'cve_counter': 0,
-                'stapel_name': 'python-urllib3',
-                'nvr_list': [self.get_latest_rpm_data("python-urllib3", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'Bind': {
-                'check_func': self.is_bind_issue,
-                'cve_counter': 0,
-                'stapel_name': 'bind',
-                'nvr_list': [self.get_latest_rpm_data("bind", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['dmitry.safonov']),
-                'watchers': None,
-            },
-            'Python': {
-                'check_func': self.is_python_issue,
-                'cve_counter': 0,
-                'stapel_name': 'python3',
-                'nvr_list': [self.get_latest_rpm_data("python3", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['ilya.leontiev']),
-                'watchers': None,
-            },
-            'DHCPD': {
-                'check_func': self.is_dhcpd_issue,
-                'cve_counter': 0,
-                'stapel_name': 'dhcp',
-                'nvr_list': [self.get_latest_rpm_data("dhcp", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['yaroslav.kokurin']),
-                'watchers': None,
-            },
-            'PostgreSQL': {
-                'check_func': self.is_postgresql_issue,
-                'cve_counter': 0,
-                'stapel_name': 'postgresql',
-                'nvr_list': [self.get_latest_rpm_data("postgresql", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['dmitry.safonov']),
-                'watchers': None,
-            },
-            'RPM': {
-                'check_func': self.is_rpm_issue,
-                'cve_counter': 0,
-                'stapel_name': 'rpm',
-                'nvr_list': [self.get_latest_rpm_data("rpm", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vitaly.peshcherov']),
-                'watchers': None,
-            },
-            'libgit2': {
-                'check_func': self.is_libgit2_issue,
-                'cve_counter': 0,
-                'stapel_name': 'libgit2',
-                'nvr_list': [self.get_latest_rpm_data("libgit2", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vitaly.peshcherov']),
-                'watchers': None,
-            },
-            'Engrampa': {
-                'check_func': self.is_engrampa_issue,
-                'cve_counter': 0,
-                'stapel_name': 'engrampa',
-                'nvr_list': [self.get_latest_rpm_data("engrampa", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['alexey.rodionov']),
-                'watchers': None,
-            },
-            'tomcat': {
-                'check_func': self.is_tomcat_issue,
-                'cve_counter': 0,
-                'stapel_name': 'tomcat',
-                'nvr_list': [self.get_latest_rpm_data("tomcat", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['kirill.ivanov']),
-                'watchers': None,
-            },
-            'hdf5': {
-                'check_func': self.is_hdf5_issue,
-                'cve_counter': 0,
-                'stapel_name': 'hdf5',
-                'nvr_list': [self.get_latest_rpm_data("hdf5", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['vladislav.mitin']),
-                'watchers': None,
-            },
-            'xen': {
-                'check_func': self.is_xen_issue,
-                'cve_counter': 0,
-                'stapel_name': 'xen',
-                'nvr_list': [self.get_latest_rpm_data("xen", tag[0], tag[1]).get('version', "")
-                             for tag in self.tags],
-                'check_patch': False,
-                'assigned_to': int(self.users_dict['oleg.sviridov']),
-                'watchers': None,
-            },
-        }
-
-    # Нижеследующие функции проверяют, относится ли уязвимость к соответствующему пакету
-    @staticmethod
-    def is_kernel_issue(desc, links, cpe) -> IsXIssue:
-        """
-        Проверка на то, что уязвимость относится к ядреной
-        """
-        check_urls = [
-            'lore.kernel.org',
-            'git.kernel.org',
-            'lkml.org',
-            'bugzilla.redhat.com',
-            'bugzilla.suse.com',
-            'cdn.kernel.org',
-            'lkml.kernel.org',
-            'kernel.dance',
-            'lists.debian.org',
-            'www.debian.org',
-            'www.spinics.net',
-            'patchwork.kernel.org',
-        ]
-
-        if ('linux kernel' not in desc) or ('android linux kernel' in desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if (netloc == 'github.com' and path_first == 'torvalds') or (netloc in check_urls):
-                return IsXIssue.YES
-
-        if cpe and (cpe[0].split(":")[4] == 'linux_kernel'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_vim_issue(desc, links, cpe) -> IsXIssue:
-        if 'vim' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'vim':
-                return IsXIssue.YES
-        if cpe and (cpe[0].split(":")[4] == 'vim'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_nextcloud_generic_issue(desc, links, cpe) -> IsXIssue:
-        if 'nextcloud' not in desc:
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and path_split[1] == 'nextcloud':
-                    return IsXIssue.MAYBE
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_nextcloud_server_issue(desc, links, cpe) -> IsXIssue:
-        if 'nextcloud server' not in desc:
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and (path_split[1] == 'nextcloud' and path_split[2] == 'server'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_nextcloud_mail_issue(desc, links, cpe) -> IsXIssue:
-        split_desc = split_and_strip(desc)
-        if 'nextcloud' not in split_desc and 'mail' not in split_desc:
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and (path_split[1] == 'nextcloud' and path_split[2] == 'mail'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_nextcloud_calendar_issue(desc, links, cpe) -> IsXIssue:
-        split_desc = split_and_strip(desc)
-        if 'nextcloud' not in split_desc and 'calendar' not in split_desc:
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and (path_split[1] == 'nextcloud' and path_split[2] == 'calendar'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_nextcloud_contacts_issue(desc, links, cpe) -> IsXIssue:
-        split_desc = split_and_strip(desc)
-        if 'nextcloud' not in split_desc and 'contacts' not in split_desc:
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and (path_split[1] == 'nextcloud' and path_split[2] == 'contacts'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_gpac_issue(desc, links, cpe) -> IsXIssue:
-        if 'gpac' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'gpac':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_redis_issue(desc, links, cpe) -> IsXIssue:
-        if 'redis' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and (path_first == 'redis' or path_first == 'RedisLabs'):
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_systemd_issue(desc, links, cpe) -> IsXIssue:
-
-        if 'systemd' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'systemd':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_django_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'docs.djangoproject.com',
-            'www.djangoproject.com',
-        ]
-        if 'django' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_moodle_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'git.moodle.org',
-            'moodle.org',
-        ]
-        if 'moodle' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'moodle':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        if cpe and (cpe[0].split(":")[4] == 'moodle'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_firefox_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'bugzilla.mozilla.org',
-            'www.mozilla.org',
-        ]
-        if 'firefox' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_thunderbird_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'bugzilla.mozilla.org',
-            'www.mozilla.org',
-        ]
-        if 'thunderbird' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_curl_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'security.netapp.com',
-            'hackerone.com',
-        ]
-        split_desc = split_and_strip(desc)
-        if ('curl' not in split_desc) and ('libcurl' not in split_desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_glpi_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'pluginsGLPI',
-            'glpi-project',
-        ]
-
-        if 'glpi' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libtiff_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'tiffcp.com',
-        ]
-
-        if 'libtiff' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'gitlab.com' and path_first == 'libtiff':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_grafana_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'grafana.com',
-        ]
-
-        if 'grafana' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'grafana':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_imagemagick_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'imagemagick.org',
-        ]
-
-        if 'imagemagick' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'ImageMagick':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_qemu_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'git.qemu.org',
-            'www.qemu.org'
-        ]
-
-        if 'qemu' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 3:
-                if netloc == 'lists.nongnu.org' and path_split[3] == 'qemu-devel':
-                    return IsXIssue.YES
-                elif netloc == 'gitlab.com' and path_split[1] == 'qemu-project' and path_split[2] == 'qemu':
-                    return IsXIssue.YES
-                elif netloc == 'gitlab.com' and path_split[1] == 'birkelund' and path_split[2] == 'qemu':
-                    return IsXIssue.YES
-                elif netloc == 'bugs.launchpad.net' and path_split[1] == 'qemu':
-                    return IsXIssue.YES
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        if cpe and (cpe[0].split(":")[4] == 'qemu'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_wireshark_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'www.wireshark.org',
-        ]
-
-        if 'wireshark' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'gitlab.com' and path_first == 'wireshark':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libvirt_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'libvirt.org',
-        ]
-
-        if 'libvirt' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'gitlab.com' and path_first == 'libvirt':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libraw_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'www.libraw.org',
-        ]
-
-        if 'libraw' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'LibRaw':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_samba_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'www.samba.org',
-            'bugzilla.samba.org',
-        ]
-
-        if 'samba' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_openssl_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'git.openssl.org',
-            'www.openssl.org',
-        ]
-
-        found_flag = 'openssl' in split_and_strip(desc)
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls and found_flag:
-                return IsXIssue.YES
-            elif netloc in check_urls and not found_flag:
-                return IsXIssue.MAYBE
-
-        return IsXIssue.NO
-
-    @staticmethod
-    def is_yasm_issue(desc, links, cpe) -> IsXIssue:
-        if 'yasm' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'yasm':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_emacs_issue(desc, links, cpe) -> IsXIssue:
-        if 'emacs' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                path_second = path_split[2]
-                if netloc == 'git.savannah.gnu.org' and path_second == 'emacs.git':
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libreswan_issue(desc, links, cpe) -> IsXIssue:
-        if 'libreswan' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'Libreswan.org',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc in check_urls:
-                return IsXIssue.YES
-            if netloc == 'github.com' and path_first == 'libreswan':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libreoffice_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'www.libreoffice.org',
-        ]
-
-        if 'libreoffice' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_sudo_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'www.sudo.ws',
-        ]
-
-        if 'sudo' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'sudo-project':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_podofo_issue(desc, links, cpe) -> IsXIssue:
-        if 'podofo' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'podofo':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_opensearch_issue(desc, links, cpe) -> IsXIssue:
-        if 'opensearch' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'opensearch-project':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libheif_issue(desc, links, cpe) -> IsXIssue:
-        if 'libheif' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and (path_split[1] == 'strukturag' and path_split[2] == 'libheif'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_flask_issue(desc, links, cpe) -> IsXIssue:
-        if 'flask' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and (path_split[1] == 'pallets' and path_split[2] == 'flask'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_cups_filters_issue(desc, links, cpe) -> IsXIssue:
-        if 'cups-filters' not in desc:
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'OpenPrinting' and path_split[2] == 'cups-filters'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_cups_issue(desc, links, cpe) -> IsXIssue:
-        if 'cups' not in desc:
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'OpenPrinting' and path_split[2] == 'cups'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_lua_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'www.lua.org',
-        ]
-
-        if 'lua' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'lua':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_nginx_issue(desc, links, cpe) -> IsXIssue:
-        if 'nginx' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'nginx':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_tcpdump_issue(desc, links, cpe) -> IsXIssue:
-        if 'tcpdump' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'the-tcpdump-group' and path_split[2] == 'tcpdump'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_tmux_issue(desc, links, cpe) -> IsXIssue:
-        if 'tmux' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'tmux' and path_split[2] == 'tmux'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_flatpak_issue(desc, links, cpe) -> IsXIssue:
-        if 'flatpak' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'flatpak' and path_split[2] == 'flatpak'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_runc_issue(desc, links, cpe) -> IsXIssue:
-        if 'runc' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'opencontainers' and path_split[2] == 'runc'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_moby_issue(desc, links, cpe) -> IsXIssue:
-        if 'moby' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'moby' and path_split[2] == 'moby'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libssh_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'www.libssh.org',
-        ]
-
-        if 'libssh' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_c_ares_issue(desc, links, cpe) -> IsXIssue:
-        if 'c-ares' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'c-ares' and path_split[2] == 'c-ares'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_avahi_issue(desc, links, cpe) -> IsXIssue:
-        if 'avahi' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'lathiat' and path_split[2] == 'avahi'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_opensc_issue(desc, links, cpe) -> IsXIssue:
-        if 'opensc' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'opensc':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_grpc_issue(desc, links, cpe) -> IsXIssue:
-        if 'grpc' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'grpc':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libjxl_issue(desc, links, cpe) -> IsXIssue:
-        if 'libjxl' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'libjxl':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libexpat_issue(desc, links, cpe) -> IsXIssue:
-        if 'libexpat' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'libexpat':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_openldap_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'git.openldap.org',
-            'bugs.openldap.org',
-        ]
-
-        if 'openldap' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_netty_issue(desc, links, cpe) -> IsXIssue:
-        if 'netty' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'netty':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_nettle_issue(desc, links, cpe) -> IsXIssue:
-        if 'nettle' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'git.lysator.liu.se' and path_first == 'nettle':
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_pypdf_issue(desc, links, cpe) -> IsXIssue:
-        if 'pypdf' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'py-pdf' and path_split[2] == 'pypdf'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_gradle_issue(desc, links, cpe) -> IsXIssue:
-        if 'gradle' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'gradle' and path_split[2] == 'gradle'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_ghostscript_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'git.ghostscript.com',
-            'bugs.ghostscript.com',
-        ]
-
-        if 'ghostscript' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_pygments_issue(desc, links, cpe) -> IsXIssue:
-        if 'pygments' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and (path_split[1] == 'pygments' and path_split[2] == 'pygments'):
-                    return IsXIssue.YES
-                elif netloc == 'pypi.org' and (path_split[1] == 'project' and path_split[2] == 'Pygments'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_cargo_issue(desc, links, cpe) -> IsXIssue:
-        if 'cargo' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'rust-lang' and path_split[2] == 'cargo'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_rust_issue(desc, links, cpe) -> IsXIssue:
-        if 'rust' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'rust-lang' and path_split[2] == 'rust'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_unrar_issue(desc, links, cpe) -> IsXIssue:
-        if 'unrar' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'pmachapman' and path_split[2] == 'unrar'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_opendkim_issue(desc, links, cpe) -> IsXIssue:
-        if 'opendkim' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'trusteddomainproject' and path_split[2] == 'OpenDKIM'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_haproxy_issue(desc, links, cpe) -> IsXIssue:
-        check_urls = [
-            'www.haproxy.org',
-        ]
-
-        if 'haproxy' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_first = parse.urlparse(link).path.split('/')[1]
-            if netloc == 'github.com' and path_first == 'haproxy':
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_gitpython_issue(desc, links, cpe) -> IsXIssue:
-        if 'gitpython' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'gitpython-developers' and path_split[2] == 'GitPython'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_djvulibre_issue(desc, links, cpe) -> IsXIssue:
-        if 'djvulibre' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'djvu.sourceforge.net',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2 and (netloc == 'sourceforge.net' and path_split[2] == 'djvu'):
-                return IsXIssue.YES
-            elif netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_nasm_issue(desc, links, cpe) -> IsXIssue:
-        if 'nasm' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'nasm.us',
-            'bugzilla.nasm.us',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_poppler_issue(desc, links, cpe) -> IsXIssue:
-        if 'poppler' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'gitlab.freedesktop.org' and \
-                        (path_split[1] == 'poppler' and path_split[2] == 'poppler'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_p7zip_issue(desc, links, cpe) -> IsXIssue:
-        if 'p7zip' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2 and (netloc == 'sourceforge.net' and path_split[2] == 'p7zip'):
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_alertmanager_issue(desc, links, cpe) -> IsXIssue:
-        if 'alertmanager' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'prometheus' and path_split[2] == 'alertmanager'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_giflib_issue(desc, links, cpe) -> IsXIssue:
-        if 'giflib' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2 and (netloc == 'sourceforge.net' and path_split[2] == 'giflib'):
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_salt_issue(desc, links, cpe) -> IsXIssue:
-        if 'salt' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'saltproject.io',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_ruby_issue(desc, links, cpe) -> IsXIssue:
-        if 'ruby' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'ruby-lang.org',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_jenkins_issue(desc, links, cpe) -> IsXIssue:
-        if 'jenkins' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'www.jenkins.io',
-            'jenkins.io',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_reportlab_issue(desc, links, cpe) -> IsXIssue:
-        if 'reportlab' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'MrBitBucket' and path_split[2] == 'reportlab-mirror'):
-                    return IsXIssue.YES
-                if netloc == 'hg.reportlab.com' and \
-                        (path_split[1] == 'hg-public' and path_split[2] == 'reportlab'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_webmin_issue(desc, links, cpe) -> IsXIssue:
-        if 'webmin' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'webmin.com',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_roundcube_issue(desc, links, cpe) -> IsXIssue:
-        if 'roundcube' not in split_and_strip(desc):
-            return IsXIssue.NO
-        check_urls = [
-            'roundcube.net',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'roundcube' and path_split[2] == 'roundcubemail'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_gnome_shell_issue(desc, links, cpe) -> IsXIssue:
-        if ('gnome' not in split_and_strip(desc)) and ('shell' not in split_and_strip(desc)):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'gitlab.gnome.org' and \
-                        (path_split[1] == 'GNOME' and path_split[2] == 'gnome-shell'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libwebp_issue(desc, links, cpe) -> IsXIssue:
-        if 'libwebp' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'chromium.googlesource.com' and \
-                        (path_split[1] == 'webm' and path_split[2] == 'libwebp'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_snappy_java_issue(desc, links, cpe) -> IsXIssue:
-        if ('snappy' not in split_and_strip(desc)) and ('java' not in split_and_strip(desc)):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'xerial' and path_split[2] == 'snappy-java'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_composer_issue(desc, links, cpe) -> IsXIssue:
-        if 'composer' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'composer' and path_split[2] == 'composer'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_optipng_issue(desc, links, cpe) -> IsXIssue:
-        if 'optipng' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'optipng.sourceforge.net',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-            if len(path_split) > 2:
-                if netloc == 'sourceforge.net' and \
-                        (path_split[1] == 'projects' and path_split[2] == 'optipng'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_jetty_issue(desc, links, cpe) -> IsXIssue:
-        if 'jetty' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'eclipse' and path_split[2] == 'jetty.project'):
-                    return IsXIssue.YES
-        if cpe and (cpe[0].split(":")[4] == 'jetty'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_mosquitto_issue(desc, links, cpe) -> IsXIssue:
-        if 'mosquitto' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'mosquitto.org',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_vorbis_tools_issue(desc, links, cpe) -> IsXIssue:
-        if ('vorbis' not in split_and_strip(desc)) and ('tools' not in split_and_strip(desc)):
-            return IsXIssue.NO
-
-        check_urls = [
-            'xiph.org',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'xiph' and path_split[2] == 'vorbis'):
-                    return IsXIssue.YES
-                elif netloc == 'github.com' and \
-                        (path_split[1] == 'xiph' and path_split[2] == 'vorbis-tools'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_kubernetes_issue(desc, links, cpe) -> IsXIssue:
-        if 'kubernetes' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'kubernetes' and path_split[2] == 'kubernetes'):
-                    return IsXIssue.YES
-
-        if cpe and (cpe[0].split(":")[4] == 'kubernetes'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_codium_issue(desc, links, cpe) -> IsXIssue:
-        if ('visual' not in split_and_strip(desc)) and \
-                ('studio' not in split_and_strip(desc)) and \
-                ('code' not in split_and_strip(desc)):
-            return IsXIssue.NO
-
-        if cpe and (cpe[0].split(":")[4] == 'visual_studio_code'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_erlang_issue(desc, links, cpe) -> IsXIssue:
-        if 'erlang' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'erlang'):
-                    return IsXIssue.YES
-
-        if cpe and (cpe[0].split(":")[4] == 'erlang'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_chromium_issue(desc, links, cpe) -> IsXIssue:
-        if 'chromium' not in split_and_strip(desc) or \
-                (('google' not in split_and_strip(desc)) and ('chrome' not in split_and_strip(desc))):
-            return IsXIssue.NO
-
-        check_urls = [
-            'crbug.com',
-            'chromereleases.googleblog.com',
-            'bugs.chromium.org',
-            'issues.chromium.org',
-            'chromium.org'
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        if cpe and (cpe[0].split(":")[4] == 'chrome'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_ffmpeg_issue(desc, links, cpe) -> IsXIssue:
-        if 'ffmpeg' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'patchwork.ffmpeg.org',
-        ]
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'FFmpeg' and path_split[2] == 'FFmpeg'):
-                    return IsXIssue.YES
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_golang_issue(desc, links, cpe) -> IsXIssue:
-        if 'golang' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'go.dev',
-            'pkg.go.dev',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
-
-        if cpe and (cpe[0].split(":")[3] == 'golang'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_cri_o_issue(desc, links, cpe) -> IsXIssue:
-        if ('cri' not in split_and_strip(desc)) and ('o' not in split_and_strip(desc)):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'cri-o' and path_split[2] == 'cri-o'):
-                    return IsXIssue.YES
-
-        if cpe and (cpe[0].split(":")[3] == 'kubernetes') \
-                and (cpe[0].split(":")[4] == 'cri-o'):
-            return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_libde265_issue(desc, links, cpe) -> IsXIssue:
-        if 'libde265' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'strukturag' and path_split[2] == 'libde265'):
-                    return IsXIssue.YES
-
-        return IsXIssue.MAYBE
-
-    @staticmethod
-    def is_openssh_issue(desc, links, cpe) -> IsXIssue:
-        if 'openssh' not in split_and_strip(desc):
-            return IsXIssue.NO
-
-        check_urls = [
-            'www.openssh.com',
-        ]
-
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if netloc in check_urls:
-                return IsXIssue.YES
+@total_ordering
+class RpmVersion:
+    """
+    Разобранная версия (или релиз) пакета, сравнивается по правилам rpmvercmp:
+    строка делится на числовые и буквенные сегменты, разделители игнорируются,
+    числа старше букв, '~' младше всего (даже конца строки), '^' старше конца строки,
+    но младше любого следующего сегмента.
+    Хэшируется и сортируется, поэтому подходит для max(), sorted(), set и dict.
+    Разбор строки выполняется один раз: используйте RpmVersion.parse
+    """
+    __slots__ = ('ver', 'key')
 
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'openssh' and path_split[2] == 'openssh-portable'):
-                    return IsXIssue.YES
+    segment_re = re.compile(r"~|\^|[0-9]+|[a-zA-Z]+")
 
-        if cpe and (cpe[0].split(":")[4] == 'openssh'):
-            return IsXIssue.YES
+    # веса сегментов. Конец строки между '~' и '^'
+    TILDE, END, CARET, ALPHA, DIGIT = range(5)
 
-        return IsXIssue.MAYBE
+    def __init__(self, ver: str):
+        self.ver = ver
+        key = []
+        for segment in self.segment_re.findall(ver):
+            if segment == '~':
+                key.append((self.TILDE,))
+            elif segment == '^':
+                key.append((self.CARET,))
+            elif segment.isdigit():
+                key.append((self.DIGIT, int(segment)))
+            else:
+                key.append((self.ALPHA, segment))
+        key.append((self.END,))
+        self.key = tuple(key)
 
     @staticmethod
-    def is_openvpn_issue(desc, links, cpe) -> IsXIssue:
-        if 'openvpn' not in split_and_strip(desc):
-            return IsXIssue.NO
+    @lru_cache(maxsize=65536)
+    def parse(ver: str) -> 'RpmVersion':
+        return RpmVersion(ver)
 
-        check_urls = [
-            'community.openvpn.net',
-            'openvpn.net',
-        ]
+    def __eq__(self, other):
+        if not isinstance(other, RpmVersion):
+            return NotImplemented
+        return self.key == other.key
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if netloc in check_urls:
-                return IsXIssue.YES
+    def __lt__(self, other):
+        if not isinstance(other, RpmVersion):
+            return NotImplemented
+        return self.key < other.key
 
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'OpenVPN' and path_split[2] == 'openvpn'):
-                    return IsXIssue.YES
+    def __hash__(self):
+        return hash(self.key)
 
-        if cpe and (cpe[0].split(":")[4] == 'openvpn'):
-            return IsXIssue.YES
+    def __repr__(self):
+        return f"RpmVersion({self.ver!r})"
 
-        return IsXIssue.MAYBE
+    def __str__(self):
+        return self.ver
 
-    @staticmethod
-    def is_openvswitch_issue(desc, links, cpe) -> IsXIssue:
-        if 'openvswitch' not in split_and_strip(desc):
-            return IsXIssue.NO
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'openvswitch'):
-                    return IsXIssue.YES
+def compare_versions(ver_a: str, ver_b: str) -> bool:
+    """
+    Сравниватель версий по старшинству (rpmvercmp). True, если ver_a не младше ver_b
+    """
+    return RpmVersion.parse(ver_a) >= RpmVersion.parse(ver_b)
 
-        if cpe and (cpe[0].split(":")[4] == 'openvswitch'):
-            return IsXIssue.YES
 
-        return IsXIssue.MAYBE
+def ver_max(ver_list: list) -> str:
+    return max(ver_list, key=RpmVersion.parse, default="0")
 
-    @staticmethod
-    def is_freerdp_issue(desc, links, cpe) -> IsXIssue:
-        if 'freerdp' not in split_and_strip(desc):
-            return IsXIssue.NO
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'FreeRDP' and path_split[2] == 'FreeRDP'):
-                    return IsXIssue.YES
+def split_and_strip(string: str) -> list:
+    return re.sub(r'[^\w\s]', ' ', string).split()
 
-        if cpe and (cpe[0].split(":")[4] == 'freerdp'):
-            return IsXIssue.YES
 
-        return IsXIssue.MAYBE
+def process_urls(urls: list) -> list:
+    """
+    Ищем ссылки нужного нам вида.
+    * https://github.com/torvalds/linux/commit/**commit** - переделывать не надо
+    * git.kernel.org - вырезаем хэш коммита и превращаем в ссылку предыдущего вида
+    * остальные ссылки не меняем
+    """
+    result = []
+    for link in urls:
+        netloc = parse.urlparse(link).netloc
+        path = parse.urlparse(link).path
+        if netloc == 'git.kernel.org' or (netloc == 'github.com' and path.split('/')[1] == 'torvalds'):
+            result.append(f'https://github.com/torvalds/linux/commit/{link.split("/")[-1].split("=")[-1]}')
+        else:
+            result.append(link)
+    # Уберем возможные дубликаты
+    result = list(set(result))
+    return result
 
-    @staticmethod
-    def is_clojure_issue(desc, links, cpe) -> IsXIssue:
-        if 'clojure' not in split_and_strip(desc):
-            return IsXIssue.NO
 
-        check_urls = [
-            'clojure.atlassian.net',
-        ]
+def prepare_cve_input(cve: dict) -> tuple:
+    """
+    Достает из записи nist то, что нужно для проверки на принадлежность к пакетам
+    :param cve: элемент vulnerabilities из ответа nist
+    :return: кортеж (описание в нижнем регистре, обработанные ссылки, configurations) - аргументы CveFeatures
+    """
+    return (cve['cve']['descriptions'][0]['value'].lower(),
+            process_urls([link['url'] for link in cve['cve']['references']]),
+            cve['cve'].get('configurations'))
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if netloc in check_urls:
-                return IsXIssue.YES
 
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'clojure' and path_split[2] == 'clojure'):
-                    return IsXIssue.YES
+# Поля диапазона уязвимых версий в cpeMatch
+CPE_RANGE_FIELDS = (
+    'versionStartIncluding',
+    'versionStartExcluding',
+    'versionEndIncluding',
+    'versionEndExcluding',
+)
 
-        if cpe and (cpe[0].split(":")[4] == 'clojure'):
-            return IsXIssue.YES
 
-        return IsXIssue.MAYBE
+def parse_cpe_matches(configurations) -> dict:
+    """
+    Разбирает все CPE из всех узлов configurations уязвимости nist
+    :param configurations: cve['cve']['configurations']
+    :return: dict вида {(vendor, product): [диапазон версий, ...]}, где диапазон -
+    dict с версией из самой CPE ('version', если она задана) и полями CPE_RANGE_FIELDS
+    """
+    result = {}
+    for configuration in configurations or []:
+        for node in configuration.get('nodes', []):
+            for cpe_match in node.get('cpeMatch', []):
+                # неуязвимые CPE описывают платформу (ОС, железо), а не уязвимый продукт
+                if not cpe_match.get('vulnerable', True):
+                    continue
+                # cpe:2.3:part:vendor:product:version:..., двоеточие внутри поля экранируется
+                cpe_split = re.split(r'(?<!\\):', cpe_match.get('criteria', ''))
+                if len(cpe_split) < 6:
+                    continue
+                version_range = {field: cpe_match[field] for field in CPE_RANGE_FIELDS if cpe_match.get(field)}
+                if cpe_split[5] not in ('*', '-'):
+                    version_range['version'] = cpe_split[5]
+                result.setdefault((cpe_split[3], cpe_split[4]), []).append(version_range)
+
+    return result
+
+
+class NvrCache:
+    """
+    Кэш ответов koji на диске (sqlite). Хранит результат get_latest_rpm_data по ключу
+    (хаб, тег, пакет) и данные тегов, чтобы повторные запуски обходились без обращений к koji
+    """
 
-    @staticmethod
-    def is_freeipa_issue(desc, links, cpe) -> IsXIssue:
-        if 'ipa' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def __init__(self, path=NVR_CACHE_PATH, ttl=NVR_CACHE_TTL, refresh=False):
+        """
+        :param path: путь к файлу базы
+        :param ttl: время жизни записи в секундах
+        :param refresh: не читать сохраненные записи, а только перезаписывать их свежими данными
+        """
+        self.ttl = ttl
+        self.refresh = refresh
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS rpm_data ("
+                          "hub TEXT, tag TEXT, package TEXT, data TEXT, updated REAL, "
+                          "PRIMARY KEY (hub, tag, package))")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS tags ("
+                          "hub TEXT, tag TEXT, data TEXT, updated REAL, "
+                          "PRIMARY KEY (hub, tag))")
+        self.conn.commit()
+
+    def get_tag(self, hub: str, tag_name: str) -> dict:
+        if self.refresh:
+            return {}
+        row = self.conn.execute("SELECT data FROM tags WHERE hub = ? AND tag = ? AND updated > ?",
+                                (hub, tag_name, time.time() - self.ttl)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def set_tag(self, hub: str, tag_name: str, tag_data: dict):
+        self.conn.execute("INSERT OR REPLACE INTO tags VALUES (?, ?, ?, ?)",
+                          (hub, tag_name, json.dumps(tag_data), time.time()))
+        self.conn.commit()
+
+    def get_rpm_data(self, hub: str, tag_name: str, package_names) -> dict:
+        """
+        :return: dict вида {имя пакета: данные} только для найденных и не устаревших записей
+        """
+        if self.refresh:
+            return {}
+        rows = self.conn.execute("SELECT package, data FROM rpm_data WHERE hub = ? AND tag = ? AND updated > ?",
+                                 (hub, tag_name, time.time() - self.ttl))
+        package_names = set(package_names)
+        return {package: json.loads(data) for package, data in rows if package in package_names}
+
+    def set_rpm_data(self, hub: str, tag_name: str, rpm_data: dict):
+        """
+        :param rpm_data: dict вида {имя пакета: данные}. Пустые ответы тоже сохраняем
+        """
+        now = time.time()
+        self.conn.executemany("INSERT OR REPLACE INTO rpm_data VALUES (?, ?, ?, ?, ?)",
+                              [(hub, tag_name, package, json.dumps(data), now)
+                               for package, data in rpm_data.items()])
+        self.conn.commit()
 
-        check_urls = [
-            'freeipa.org',
-        ]
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
+class CveFeatures:
+    """
+    Данные уязвимости, которые нужны функциям проверки, разобранные один раз на уязвимость
+    """
 
-        if cpe and (cpe[0].split(":")[4] == 'freeipa'):
-            return IsXIssue.YES
+    def __init__(self, desc: str, links: list, configurations=None):
+        """
+        :param desc: описание уязвимости в нижнем регистре
+        :param links: обработанные ссылки (process_urls)
+        :param configurations: cve['cve']['configurations'] из ответа nist
+        """
+        self.desc = desc
+        self.links = links
+        # (хост, сегменты пути без ведущего пустого)
+        self.urls = [(url.netloc, url.path.split('/')[1:]) for url in map(parse.urlparse, links)]
+        self.netlocs = {netloc for netloc, _ in self.urls}
+        # {(vendor, product): [диапазоны версий]} по всем уязвимым CPE
+        self.cpe_ranges = parse_cpe_matches(configurations)
+        self.cpe_products = {product for _, product in self.cpe_ranges}
+
+    @cached_property
+    def tokens(self) -> set:
+        """
+        Слова описания. Нужны только функциям проверки, поэтому разбираются при первом обращении
+        """
+        return set(split_and_strip(self.desc))
 
-        return IsXIssue.MAYBE
 
-    @staticmethod
-    def is_kate_issue(desc, links, cpe) -> IsXIssue:
-        if ('kde' not in split_and_strip(desc)) and ('kate' not in split_and_strip(desc)):
-            return IsXIssue.NO
+class KeywordMatcher:
+    """
+    Поиск сразу всех шаблонов в тексте за один проход.
+    Шаблоны собираются в префиксное дерево, а оно - в регулярное выражение,
+    так что на каждой позиции текста проверяется только ветка дерева для текущего символа.
+    words - шаблоны, которые должны стоять в тексте отдельным словом (как токены split_and_strip),
+    phrases - шаблоны, которые ищутся как подстроки
+    """
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
+    def __init__(self, words=(), phrases=()):
+        words, phrases = set(words), set(phrases)
+        # слова не пересекаются друг с другом, поэтому хватает обычного поиска с границами слова
+        self.words_regex = re.compile(rf"\b(?:{self.__trie_regex(words)})\b") if words else None
+        # фразы могут пересекаться, поэтому ищем их на каждой позиции через lookahead.
+        # На одной позиции находится только самая длинная фраза, остальные совпавшие там же - ее префиксы
+        self.prefixes = {phrase: [other for other in phrases if phrase.startswith(other)] for phrase in phrases}
+        self.phrases_regex = re.compile(f"(?=({self.__trie_regex(phrases)}))") if phrases else None
+
+    @staticmethod
+    def __trie_regex(patterns) -> str:
+        trie = {}
+        for pattern in patterns:
+            node = trie
+            for char in pattern:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def build(node):
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            regex = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            # если шаблон кончается в этом узле, продолжение необязательно
+            return f"(?:{regex})?" if '' in node else regex
+
+        return build(trie)
+
+    def scan(self, text: str) -> (set, set):
+        """
+        :return: найденные в тексте слова и найденные фразы отдельно. Шаблон, который есть и среди слов,
+        и среди фраз, в словах оказывается, только если стоит в тексте отдельным словом
+        """
+        words, phrases = set(), set()
+        if self.words_regex is not None:
+            words.update(self.words_regex.findall(text))
+        if self.phrases_regex is not None:
+            for phrase in set(self.phrases_regex.findall(text)):
+                phrases.update(self.prefixes[phrase])
 
-            if len(path_split) > 2:
-                if netloc == 'apps.kde.org' and \
-                        (path_split[1] == 'kate'):
-                    return IsXIssue.YES
+        return words, phrases
 
-        if cpe and (cpe[0].split(":")[4] == 'kate'):
-            return IsXIssue.YES
 
-        return IsXIssue.MAYBE
+class LinkIndex:
+    """
+    Индекс ссылок, подтверждающих уязвимость: хост и хост + начало пути -> пакеты.
+    Каждая ссылка проверяется поиском по словарю, а не сравнением со списками хостов всех пакетов.
+    Хост, начинающийся с точки ('.example.org'), совпадает с самим доменом и любым его поддоменом
+    """
+
+    def __init__(self):
+        self.netlocs = {}
+        # (хост, первый сегмент пути) -> [(остальные сегменты префикса, пакет)]
+        self.path_prefixes = {}
+
+    def add_netloc(self, netloc, pkg_name):
+        self.netlocs.setdefault(netloc, set()).add(pkg_name)
+
+    def add_path_prefix(self, prefix: list, pkg_name):
+        """
+        :param prefix: [хост, сегмент пути, ...], '*' совпадает с любым сегментом
+        """
+        self.path_prefixes.setdefault((prefix[0], prefix[1]), []).append((tuple(prefix[2:]), pkg_name))
 
     @staticmethod
-    def is_atril_issue(desc, links, cpe) -> IsXIssue:
-        if 'atril' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def host_keys(netloc) -> list:
+        """
+        :return: сам хост и ключи для совпадения по домену: 'a.b.org' -> ['a.b.org', '.a.b.org', '.b.org']
+        """
+        labels = netloc.split('.')
+        return [netloc] + ['.' + '.'.join(labels[i:]) for i in range(len(labels) - 1)]
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'mate-desktop' and path_split[2] == 'atril'):
-                    return IsXIssue.YES
+    def match(self, urls) -> set:
+        """
+        :param urls: ссылки в виде (хост, сегменты пути), как в CveFeatures.urls
+        :return: пакеты, которые подтверждаются ссылками
+        """
+        confirmed = set()
+        for netloc, path_split in urls:
+            for host in self.host_keys(netloc):
+                confirmed.update(self.netlocs.get(host, ()))
+                for first in (*path_split[:1], '*'):
+                    for prefix, pkg_name in self.path_prefixes.get((host, first), ()):
+                        if len(path_split) > len(prefix) and \
+                                all(item in ('*', path_split[i + 1]) for i, item in enumerate(prefix)):
+                            confirmed.add(pkg_name)
 
-        if cpe and (cpe[0].split(":")[4] == 'atril'):
-            return IsXIssue.YES
+        return confirmed
 
-        return IsXIssue.MAYBE
 
-    @staticmethod
-    def is_tinyxml_issue(desc, links, cpe) -> IsXIssue:
-        if 'tinyxml' not in split_and_strip(desc):
-            return IsXIssue.NO
+class RuleEngine:
+    """
+    Правила проверки уязвимостей из pkg_rules.json, собранные в индексы.
+    Вместо вызова отдельной функции на каждый пакет все правила проверяются за один проход по уязвимости.
+
+    Поля правила пакета:
+    * keywords - хотя бы одно из слов должно быть в описании отдельным словом
+    * phrases - хотя бы одна из подстрок должна быть в описании
+    * netlocs - ссылка на один из этих хостов подтверждает уязвимость. '.example.org' - домен и все его поддомены
+    * path_prefixes - [хост, сегмент пути, ...], '*' совпадает с любым сегментом. Совпадение подтверждает уязвимость
+    * cpe - [{'vendor': ..., 'product': ...}], совпадение с любой уязвимой CPE подтверждает уязвимость
+    Если описание подходит и есть подтверждение - YES, без подтверждения - MAYBE, иначе - NO
+
+    Для пакетов с собственной функцией проверки (check_func):
+    * triggers - подстроки описания, при которых функция вызывается
+    * trigger_netlocs - хосты в ссылках, при которых функция вызывается
+    Если ни того, ни другого нет, функция вызывается для каждой уязвимости
+    """
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'sourceforge.net' and \
-                        (path_split[2] == 'tinyxml'):
-                    return IsXIssue.YES
+    def __init__(self, rules: dict, custom_checks=None):
+        """
+        :param rules: правила из pkg_rules.json
+        :param custom_checks: dict вида {имя пакета: функция проверки}
+        """
+        self.rules = rules
+        self.order = {}
+        self.keywords = {}
+        self.phrases = {}
+        self.links = LinkIndex()
+        self.cpe = {}
+        self.custom_checks = custom_checks or {}
+        self.triggers = {}
+        self.trigger_netlocs = {}
+        self.always_checked = []
+
+        for n, (pkg_name, rule) in enumerate(rules.items()):
+            self.order[pkg_name] = n
+            for keyword in rule.get('keywords', []):
+                if not re.fullmatch(r'\w+', keyword):
+                    raise ValueError(f"{pkg_name}: keyword '{keyword}' can't be a single word, use phrases")
+                self.keywords.setdefault(keyword, []).append(pkg_name)
+            for phrase in rule.get('phrases', []):
+                self.phrases.setdefault(phrase, []).append(pkg_name)
+            for netloc in rule.get('netlocs', []):
+                self.links.add_netloc(netloc, pkg_name)
+            for prefix in rule.get('path_prefixes', []):
+                self.links.add_path_prefix(prefix, pkg_name)
+            for cpe in rule.get('cpe', []):
+                self.cpe.setdefault((cpe.get('vendor'), cpe.get('product')), []).append(pkg_name)
+
+            if pkg_name in self.custom_checks:
+                for trigger in rule.get('triggers', []):
+                    self.triggers.setdefault(trigger, []).append(pkg_name)
+                for netloc in rule.get('trigger_netlocs', []):
+                    self.trigger_netlocs.setdefault(netloc, []).append(pkg_name)
+                if not rule.get('triggers') and not rule.get('trigger_netlocs'):
+                    self.always_checked.append(pkg_name)
+
+        self.matcher = KeywordMatcher(words=self.keywords, phrases=set(self.phrases) | set(self.triggers))
+
+    @cached_property
+    def fingerprints(self) -> dict:
+        """
+        Отпечатки правил: меняются, только если могут поменяться вердикты пакета
+        (правило, его функция проверки или RULE_ENGINE_VERSION)
+        :return: dict вида {имя пакета: отпечаток}
+        """
+        fingerprints = {}
+        for pkg_name, rule in self.rules.items():
+            digest = hashlib.sha1(f"{RULE_ENGINE_VERSION}".encode())
+            digest.update(json.dumps({key: value for key, value in rule.items() if key not in RULE_TRACKER_FIELDS},
+                                     sort_keys=True).encode())
+            if pkg_name in self.custom_checks:
+                try:
+                    digest.update(inspect.getsource(self.custom_checks[pkg_name]).encode())
+                except (OSError, TypeError):
+                    digest.update(self.custom_checks[pkg_name].__qualname__.encode())
+            fingerprints[pkg_name] = digest.hexdigest()[:12]
+
+        return fingerprints
+
+    def subset(self, pkg_names) -> 'RuleEngine':
+        """
+        Движок только с правилами указанных пакетов, для перепроверки после правки правил
+        """
+        return RuleEngine({pkg_name: rule for pkg_name, rule in self.rules.items() if pkg_name in pkg_names},
+                          {pkg_name: check for pkg_name, check in self.custom_checks.items() if pkg_name in pkg_names})
 
-        if cpe and (cpe[0].split(":")[4] == 'tinyxml'):
-            return IsXIssue.YES
+    def find_candidates(self, features: CveFeatures) -> (set, set):
+        """
+        :return: пакеты, подходящие по описанию, и пакеты, чьи собственные функции проверки нужно вызвать
+        """
+        candidates, triggered = set(), set(self.always_checked)
+        words, phrases = self.matcher.scan(features.desc)
+        # ключевое слово ищется только среди целых слов: "nextcloud" в "nextcloudpi" - фраза пакета nextcloud,
+        # но не ключевое слово nextcloud-mail
+        for word in words:
+            candidates.update(self.keywords.get(word, ()))
+        for phrase in phrases:
+            candidates.update(self.phrases.get(phrase, ()))
+            triggered.update(self.triggers.get(phrase, ()))
+
+        for netloc in features.netlocs:
+            triggered.update(self.trigger_netlocs.get(netloc, ()))
+
+        return candidates, triggered
+
+    def find_candidates_plain(self, features: CveFeatures) -> (set, set):
+        """
+        То же, что find_candidates, но перебором: ключевые слова - среди токенов описания, фразы и триггеры -
+        подстроки описания. Медленно, нужно только для сверки с KeywordMatcher (bench_classifier.py)
+        """
+        candidates, triggered = set(), set(self.always_checked)
+        for token in features.tokens:
+            candidates.update(self.keywords.get(token, ()))
+        for phrase, pkg_names in self.phrases.items():
+            if phrase in features.desc:
+                candidates.update(pkg_names)
+        for trigger, pkg_names in self.triggers.items():
+            if trigger in features.desc:
+                triggered.update(pkg_names)
+        for netloc in features.netlocs:
+            triggered.update(self.trigger_netlocs.get(netloc, ()))
+
+        return candidates, triggered
+
+    def confirm(self, features: CveFeatures) -> set:
+        """
+        :return: пакеты, которые подтверждаются ссылками или CPE уязвимости
+        """
+        confirmed = self.links.match(features.urls)
+        for vendor, product in features.cpe_ranges:
+            for key in ((vendor, product), (None, product), (vendor, None)):
+                confirmed.update(self.cpe.get(key, ()))
 
-        return IsXIssue.MAYBE
+        return confirmed
 
-    @staticmethod
-    def is_apache_issue(desc, links, cpe) -> IsXIssue:
-        if ('apache' not in split_and_strip(desc)) and ('http' not in split_and_strip(desc)):
-            return IsXIssue.NO
+    def sort_verdicts(self, verdicts: dict) -> dict:
+        return dict(sorted(verdicts.items(), key=lambda item: self.order[item[0]]))
 
-        check_urls = [
-            'httpd.apache.org',
-        ]
+    def evaluate(self, features: CveFeatures) -> dict:
+        """
+        :return: dict вида {имя пакета: IsXIssue} без вердиктов NO, в порядке правил
+        """
+        candidates, triggered = self.find_candidates(features)
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
+        verdicts = {}
+        if candidates:
+            confirmed = self.confirm(features)
+            verdicts = {pkg_name: IsXIssue.YES if pkg_name in confirmed else IsXIssue.MAYBE
+                        for pkg_name in candidates}
 
-        if cpe and \
-                (cpe[0].split(":")[3] == 'apache' and cpe[0].split(":")[4] == 'http_server'):
-            return IsXIssue.YES
+        for pkg_name in triggered:
+            is_pkg = self.custom_checks[pkg_name](features)
+            if is_pkg != IsXIssue.NO:
+                verdicts[pkg_name] = is_pkg
 
-        return IsXIssue.MAYBE
+        return self.sort_verdicts(verdicts)
 
-    @staticmethod
-    def is_urllib3_issue(desc, links, cpe) -> IsXIssue:
-        if 'urllib3' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def checker(self, pkg_name):
+        """
+        Функция проверки одного пакета с той же сигнатурой, что и у is_*_issue. Проверяет только правило этого пакета
+        """
+        engine = self.subset([pkg_name])
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
+        def check_func(features: CveFeatures) -> IsXIssue:
+            return engine.evaluate(features).get(pkg_name, IsXIssue.NO)
 
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'urllib3' and path_split[2] == 'urllib3'):
-                    return IsXIssue.YES
+        return check_func
 
-        if cpe and (cpe[0].split(":")[4] == 'urllib3'):
-            return IsXIssue.YES
 
-        return IsXIssue.MAYBE
+class InstrumentedRuleEngine(RuleEngine):
+    """
+    RuleEngine, который считает по каждому пакету число проверок, время и вердикты.
+    Создается вместо RuleEngine только по запросу, так что без него на подсчеты не тратится ничего.
+    Пакет считается проверенным, если подошел по описанию или была вызвана его функция проверки.
+    Время подтверждения ссылками и CPE общее на уязвимость и делится поровну между подошедшими пакетами.
+    Движки из subset считают в те же счетчики
+    """
 
-    @staticmethod
-    def is_bind_issue(desc, links, cpe) -> IsXIssue:
-        if 'bind' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def __init__(self, rules: dict, custom_checks=None, parent=None):
+        """
+        :param parent: движок, чьи счетчики пополнять (для subset)
+        """
+        super().__init__(rules, custom_checks)
+        # сколько уязвимостей проверено: {пакеты subset: число}, None - все пакеты
+        self.key = frozenset(rules) if parent else None
+        self.runs = parent.runs if parent else {}
+        self.stage_time = parent.stage_time if parent else {'scan': 0.0, 'confirm': 0.0, 'custom': 0.0}
+        self.package_stats = parent.package_stats if parent else {}
+
+    def subset(self, pkg_names) -> 'RuleEngine':
+        engine = super().subset(pkg_names)
+        return InstrumentedRuleEngine(engine.rules, engine.custom_checks, parent=self)
+
+    def __count(self, pkg_name, is_pkg, elapsed):
+        stats = self.package_stats.setdefault(pkg_name, {'calls': 0, 'time': 0.0, 'YES': 0, 'MAYBE': 0})
+        stats['calls'] += 1
+        stats['time'] += elapsed
+        if is_pkg != IsXIssue.NO:
+            stats[is_pkg.name] += 1
+
+    def evaluate(self, features: CveFeatures) -> dict:
+        self.runs[self.key] = self.runs.get(self.key, 0) + 1
+        start = time.perf_counter()
+        candidates, triggered = self.find_candidates(features)
+        self.stage_time['scan'] += time.perf_counter() - start
+
+        verdicts = {}
+        if candidates:
+            start = time.perf_counter()
+            confirmed = self.confirm(features)
+            elapsed = time.perf_counter() - start
+            self.stage_time['confirm'] += elapsed
+            for pkg_name in candidates:
+                verdicts[pkg_name] = IsXIssue.YES if pkg_name in confirmed else IsXIssue.MAYBE
+                self.__count(pkg_name, verdicts[pkg_name], elapsed / len(candidates))
+
+        for pkg_name in triggered:
+            start = time.perf_counter()
+            is_pkg = self.custom_checks[pkg_name](features)
+            elapsed = time.perf_counter() - start
+            self.stage_time['custom'] += elapsed
+            self.__count(pkg_name, is_pkg, elapsed)
+            if is_pkg != IsXIssue.NO:
+                verdicts[pkg_name] = is_pkg
+
+        return self.sort_verdicts(verdicts)
+
+    def report(self) -> dict:
+        """
+        NO - все проверенные уязвимости, по которым пакет не получил YES или MAYBE: пакеты на правилах
+        отсеиваются поиском по описанию без вызова проверки, так что отдельно NO для них не посчитать.
+        Уязвимость проверена на пакет, если проверялась на все пакеты или на subset с ним
+        :return: статистика, пакеты отсортированы по убыванию времени, время в мс
+        """
+        cves = self.runs.get(None, 0)
+
+        def checked(pkg_name):
+            return cves + sum(count for key, count in self.runs.items() if key and pkg_name in key)
+
+        return {
+            'cves': cves,
+            'rechecked': sum(count for key, count in self.runs.items() if key),
+            'stages_ms': {stage: round(seconds * 1000, 3) for stage, seconds in self.stage_time.items()},
+            'packages': {pkg_name: dict(stats, time=round(stats['time'] * 1000, 3),
+                                        NO=max(checked(pkg_name) - stats['YES'] - stats['MAYBE'], 0))
+                         for pkg_name, stats in sorted(self.package_stats.items(), key=lambda item: -item[1]['time'])},
+        }
 
-        check_urls = [
-            'kb.isc.org',
-        ]
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
+# Правила для дочерних процессов классификации. Задается перед созданием пула (start_workers) и достается им через fork
+_worker_engine = None
 
-        if cpe and (cpe[0].split(":")[4] == 'bind'):
-            return IsXIssue.YES
 
-        return IsXIssue.MAYBE
+def _classify_worker(cve_input) -> dict:
+    """
+    Классификация одной уязвимости в дочернем процессе
+    :param cve_input: кортеж (описание, ссылки, configurations), как аргументы CveFeatures
+    """
+    return _worker_engine.evaluate(CveFeatures(*cve_input))
 
-    @staticmethod
-    def is_python_issue(desc, links, cpe) -> IsXIssue:
-        if 'python' not in split_and_strip(desc):
-            return IsXIssue.NO
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
+class PkgData(dict):
+    """
+    Данные пакета из pkgs_data. nvr_list вычисляется при первом обращении
+    и дальше хранится как обычный ключ словаря
+    """
 
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'python' and path_split[2] == 'cpython'):
-                    return IsXIssue.YES
+    def __init__(self, data: dict, resolver):
+        """
+        :param data: словарь с данными пакета
+        :param resolver: функция, заполняющая nvr_list по списку имен пакетов в stapel
+        """
+        super().__init__(data)
+        self.resolver = resolver
 
-        if cpe and (cpe[0].split(":")[3] == 'python' and cpe[0].split(":")[4] == 'python'):
-            return IsXIssue.YES
+    def __missing__(self, key):
+        if key != 'nvr_list':
+            raise KeyError(key)
+        self.resolver([self['stapel_name']])
+        return dict.__getitem__(self, key)
 
-        return IsXIssue.MAYBE
+
+class PkgHandler:
 
     @staticmethod
-    def is_dhcpd_issue(desc, links, cpe) -> IsXIssue:
-        if 'dhcpd' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def select_latest_build(package_list_raw: list) -> dict:
+        """
+        Выбирает из списка сборок пакета старшую: по эпохе, затем по версии и релизу
+        :param package_list_raw: список сборок, полученный через listTagged
+        :return: dict с инфой по пакету в случае успеха, пустой dict в противном случае
+        """
+        # выделим старшую эпоху
+        epoch_list = [i['epoch'] for i in package_list_raw if i['epoch']]
+        latest_epoch = max(epoch_list) if epoch_list else None
+        latest_rpms = list(
+            filter(lambda x: x['epoch'] == latest_epoch, package_list_raw)) \
+            if latest_epoch else package_list_raw
+        # старшую версию, а среди них старший релиз
+        return max(latest_rpms,
+                   key=lambda x: (RpmVersion.parse(x['version']), RpmVersion.parse(x['release'].split('.')[0])),
+                   default={})
 
-        if cpe and \
-                (cpe[0].split(":")[3] == 'isc' and cpe[0].split(":")[4] == 'dhcpd'):
-            return IsXIssue.YES
+    @staticmethod
+    def get_latest_rpm_data(package_name, tag_name, session, deep=True) -> dict:
+        """
+        На входе получает имя пакета, на выходе отдает dict с информацией по нему
+        :param package_name: Имя пакета
+        :param tag_name: Тег, в котором проверяем
+        :param session: объект сессии koji
+        :param deep: Флаг, какую логику использовать для поиска последнего пакета.
+        В случае False будет брать последней по дате, что может быть не слишком удачным выбором
+        :return: dict с инфой по пакету в случае успеха, пустой dict в противном случае
+        """
+        if deep:
+            package_list_raw = session.listTagged(tag_name['id'], package=package_name)
+            if package_list_raw:
+                return PkgHandler.select_latest_build(package_list_raw)
+            # на случай если не нашли в теге, ищем через наследование по простому
 
-        return IsXIssue.MAYBE
+        package_list = session.getLatestRPMS(tag_name['id'], arch='src', package=package_name)[1]
+        return package_list[0] if package_list else {}
 
-    @staticmethod
-    def is_postgresql_issue(desc, links, cpe) -> IsXIssue:
-        if 'postgresql' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def get_latest_rpm_data_bulk(self, package_names, shallow=()) -> dict:
+        """
+        Пакетный вариант get_latest_rpm_data для всех тегов из self.tags.
+        Запросы к koji отправляются через multicall: на каждую сессию один запрос listTagged
+        и один getLatestRPMS для пакетов, которых в теге не нашлось. Каждое имя запрашивается один раз,
+        пары (пакет, тег), уже лежащие в nvr_cache, в koji не запрашиваются вовсе.
+        В режиме snapshot данные берутся из снимка тегов целиком (см. get_tag_snapshots)
+        :param package_names: имена пакетов (могут повторяться)
+        :param shallow: имена пакетов, для которых используем логику deep=False
+        :return: dict вида {(имя пакета, имя тега): dict с инфой по пакету}
+        """
+        package_names = list(dict.fromkeys(package_names))
+        result = {}
+
+        session_tags = {}
+        for tag, session in self.tags:
+            session_tags.setdefault(session, []).append(tag)
+
+        for session, tags in session_tags.items():
+            fetched = {tag['name']: {} for tag in tags}
+            cached = {tag['name']: self.nvr_cache.get_rpm_data(session.baseurl, tag['name'], package_names)
+                      if self.nvr_cache else {} for tag in tags}
+            for tag_name, tag_data in cached.items():
+                result.update({(name, tag_name): data for name, data in tag_data.items()})
+
+            deep_pairs = [(name, tag) for tag in tags for name in package_names
+                          if name not in shallow and name not in cached[tag['name']]]
+            latest_pairs = [(name, tag) for tag in tags for name in package_names
+                            if name in shallow and name not in cached[tag['name']]]
+
+            if deep_pairs:
+                for pair, package_list_raw in zip(deep_pairs, self.__list_tagged(session, deep_pairs)):
+                    if package_list_raw:
+                        fetched[pair[1]['name']][pair[0]] = self.select_latest_build(package_list_raw)
+                    else:
+                        # на случай если не нашли в теге, ищем через наследование по простому
+                        latest_pairs.append(pair)
+
+            if latest_pairs:
+                for pair, package_list in zip(latest_pairs, self.__get_latest_builds(session, latest_pairs)):
+                    fetched[pair[1]['name']][pair[0]] = package_list[0] if package_list else {}
+
+            for tag_name, tag_data in fetched.items():
+                result.update({(name, tag_name): data for name, data in tag_data.items()})
+                if self.nvr_cache and tag_data:
+                    self.nvr_cache.set_rpm_data(session.baseurl, tag_name, tag_data)
+
+        return result
+
+    def __list_tagged(self, session, pairs) -> list:
+        """
+        listTagged для списка пар (пакет, тег): одним multicall либо из снимка тегов
+        """
+        if self.snapshot:
+            snapshots = self.get_tag_snapshots(session, [tag for _, tag in pairs])
+            return [snapshots[tag['name']][0].get(name, []) for name, tag in pairs]
 
-        check_urls = [
-            'www.postgresql.org',
-            'git.postgresql.org',
-        ]
+        with session.multicall(batch=KOJI_MULTICALL_BATCH) as m:
+            calls = [m.listTagged(tag['id'], package=name) for name, tag in pairs]
+        return [call.result for call in calls]
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
-                return IsXIssue.YES
+    def __get_latest_builds(self, session, pairs) -> list:
+        """
+        Последние сборки (с учетом наследования) для списка пар (пакет, тег):
+        одним multicall getLatestRPMS либо из снимка тегов
+        """
+        if self.snapshot:
+            snapshots = self.get_tag_snapshots(session, [tag for _, tag in pairs])
+            return [snapshots[tag['name']][1].get(name, []) for name, tag in pairs]
 
-        if cpe and (cpe[0].split(":")[3] == 'postgresql' and cpe[0].split(":")[4] == 'postgresql'):
-            return IsXIssue.YES
+        with session.multicall(batch=KOJI_MULTICALL_BATCH) as m:
+            calls = [m.getLatestRPMS(tag['id'], arch='src', package=name) for name, tag in pairs]
+        return [call.result[1] for call in calls]
 
-        return IsXIssue.MAYBE
+    def get_tag_snapshots(self, session, tags) -> dict:
+        """
+        Снимок содержимого тегов целиком: один listTagged и один getLatestRPMS без фильтра по пакету
+        на каждый тег, все в одном multicall. Снимок каждого тега запрашивается один раз за запуск
+        :param session: объект сессии koji
+        :param tags: теги этой сессии
+        :return: dict вида {имя тега: (сборки в теге, последние сборки с учетом наследования)},
+        где сборки сгруппированы в dict по имени пакета
+        """
+        missing = list({tag['name']: tag for tag in tags if tag['name'] not in self.tag_snapshots}.values())
+        if not missing:
+            return self.tag_snapshots
+
+        with session.multicall(batch=KOJI_MULTICALL_BATCH) as m:
+            calls = [(tag, m.listTagged(tag['id']), m.getLatestRPMS(tag['id'], arch='src')) for tag in missing]
+        for tag, tagged, latest in calls:
+            tagged_index, latest_index = {}, {}
+            for build in tagged.result:
+                tagged_index.setdefault(build['package_name'], []).append(build)
+            for build in latest.result[1]:
+                latest_index.setdefault(build['package_name'], []).append(build)
+            self.tag_snapshots[tag['name']] = (tagged_index, latest_index)
+
+        return self.tag_snapshots
+
+    def get_tag(self, tag_name: str, session) -> dict:
+        """
+        getTag с учетом локального кэша
+        """
+        tag_data = self.nvr_cache.get_tag(session.baseurl, tag_name) if self.nvr_cache else {}
+        if not tag_data:
+            tag_data = session.getTag(tag_name)
+            if self.nvr_cache and tag_data:
+                self.nvr_cache.set_tag(session.baseurl, tag_name, tag_data)
+        return tag_data
+
+    def resolve_nvr_lists(self, stapel_names):
+        """
+        Заполняет nvr_list для пакетов с заданными именами в stapel одним пакетным запросом к koji
+        """
+        stapel_names = set(stapel_names)
+        shallow = {pkg_data['stapel_name'] for pkg_data in self.pkgs_data.values()
+                   if not pkg_data.get('deep_search', True)}
+        rpm_data = self.get_latest_rpm_data_bulk(stapel_names, shallow=shallow)
+        # заодно заполним и пакеты с тем же именем в stapel (например, nextcloud)
+        for pkg_data in self.pkgs_data.values():
+            if pkg_data['stapel_name'] in stapel_names:
+                pkg_data['nvr_list'] = [rpm_data.get((pkg_data['stapel_name'], tag[0]['name']), {}).get('version', "")
+                                        for tag in self.tags]
+
+    def prefetch_nvrs(self, pkg_names):
+        """
+        Заранее и разом получает nvr_list для пакетов из pkgs_data, у которых он еще не вычислен
+        :param pkg_names: ключи pkgs_data. Отсутствующие в нем имена пропускаются
+        """
+        stapel_names = {self.pkgs_data[name]['stapel_name'] for name in pkg_names
+                        if name in self.pkgs_data and 'nvr_list' not in self.pkgs_data[name]}
+        if stapel_names:
+            self.resolve_nvr_lists(stapel_names)
 
     @staticmethod
-    def is_rpm_issue(desc, links, cpe) -> IsXIssue:
-        if 'rpm' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def load_pkg_rules(path=PKG_RULES_PATH) -> dict:
+        with open(path) as f:
+            return json.load(f)
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'rpm-software-management' and path_split[2] == 'rpm'):
-                    return IsXIssue.YES
+    @classmethod
+    def make_rule_engine(cls, pkg_rules: dict, stats=False) -> RuleEngine:
+        """
+        Собирает правила проверки. Не требует ни koji, ни users.json, поэтому годится и для отладки правил
+        :param stats: собирать статистику по пакетам (InstrumentedRuleEngine)
+        """
+        # пакеты, которые не описать правилами, проверяются своими функциями (ядро, chromium и т.п.)
+        custom_checks = {pkg_name: getattr(cls, rule['check_func'])
+                         for pkg_name, rule in pkg_rules.items() if rule.get('check_func')}
+        return (InstrumentedRuleEngine if stats else RuleEngine)(pkg_rules, custom_checks)
 
-        if cpe and (cpe[0].split(":")[3] == 'rpm' and cpe[0].split(":")[4] == 'rpm'):
-            return IsXIssue.YES
+    def make_pkg_data(self, pkg_name, rule: dict) -> dict:
+        """
+        Собирает запись pkgs_data из правила в pkg_rules.json
+        """
+        # если ответственных несколько, назначаем на случайного из них
+        assignee = choice(rule['assignee']) if isinstance(rule['assignee'], list) else rule['assignee']
+        return {
+            'cve_counter': 0,
+            'stapel_name': rule['stapel_name'],
+            'deep_search': rule.get('deep_search', True),
+            'check_patch': rule.get('check_patch', False),
+            'assigned_to': int(self.users_dict[assignee]),
+            'watchers': [int(self.users_dict[user]) for user in rule['watchers']] if rule.get('watchers') else None,
+        }
 
-        return IsXIssue.MAYBE
+    def classify(self, features: CveFeatures) -> dict:
+        """
+        Проверяет уязвимость сразу на все пакеты. Описание просматривается один раз,
+        дальше проверяются только пакеты, чьи ключевые слова в нем нашлись
+        :return: dict вида {имя пакета: IsXIssue} без вердиктов NO, в порядке pkgs_data
+        """
+        return self.rule_engine.evaluate(features)
 
-    @staticmethod
-    def is_libgit2_issue(desc, links, cpe) -> IsXIssue:
-        if 'libgit2' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def start_workers(self, workers: int):
+        """
+        Запускает процессы для classify_many. Пул создается один раз на весь запуск и до того, как появятся
+        другие потоки (запросы к NIST в несколько потоков): fork многопоточного процесса может оставить
+        дочерний процесс с блокировкой, захваченной потоком, которого в нем нет
+        :param workers: число процессов, при workers <= 1 пул не создается
+        """
+        # статистика копится в самом движке, из дочерних процессов ее не собрать
+        if workers <= 1 or self.pool or isinstance(self.rule_engine, InstrumentedRuleEngine):
+            return
+
+        global _worker_engine
+        _worker_engine = self.rule_engine
+        # fork, а не spawn: дочерним процессам не нужно заново читать правила и ходить в koji
+        self.pool = multiprocessing.get_context('fork').Pool(workers)
+
+    def stop_workers(self):
+        if self.pool:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def classify_many(self, cve_inputs: list) -> list:
+        """
+        Классифицирует пачку уязвимостей, если запущены процессы (start_workers) - в них
+        :param cve_inputs: список кортежей (описание, ссылки, configurations), как аргументы CveFeatures
+        :return: список результатов classify в том же порядке, что и cve_inputs
+        """
+        if not self.pool or len(cve_inputs) <= CLASSIFY_CHUNK_SIZE:
+            return [self.classify(CveFeatures(*cve_input)) for cve_input in cve_inputs]
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'libgit2' and path_split[2] == 'libgit2'):
-                    return IsXIssue.YES
+        return self.pool.map(_classify_worker, cve_inputs, chunksize=CLASSIFY_CHUNK_SIZE)
 
-        if cpe and (cpe[0].split(":")[4] == 'libgit2'):
-            return IsXIssue.YES
+    def __init__(self, nvr_cache=None, snapshot=False, checker_stats=False):
+        """
+        :param nvr_cache: объект NvrCache. Если не задан, данные всегда берутся из koji
+        :param snapshot: получать содержимое тегов целиком вместо запросов по каждому пакету.
+        Выгодно, когда пакетов много или нужны версии почти всех из них
+        :param checker_stats: собирать статистику проверок по пакетам (rule_engine.report())
+        """
 
-        return IsXIssue.MAYBE
+        with open(USERS_LIST) as f:
+            self.users_dict = json.loads(f.read())
 
-    @staticmethod
-    def is_engrampa_issue(desc, links, cpe) -> IsXIssue:
-        if 'engrampa' not in split_and_strip(desc):
-            return IsXIssue.NO
+        self.nvr_cache = nvr_cache
+        self.snapshot = snapshot
+        # процессы для classify_many (start_workers)
+        self.pool = None
+        self.tag_snapshots = {}
+        self.session_st7 = koji.ClientSession(KOJI7_URL)
+        self.session_st8 = koji.ClientSession(KOJI8_URL)
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'mate-desktop' and path_split[2] == 'engrampa'):
-                    return IsXIssue.YES
+        self.tags = [(self.get_tag(tag, self.session_st7), self.session_st7) for tag in TAG_LIST_ST7]
+        self.tags.extend([(self.get_tag(tag, self.session_st8), self.session_st8) for tag in TAG_LIST_ST8])
 
-        if cpe and (cpe[0].split(":")[4] == 'engrampa'):
-            return IsXIssue.YES
+        pkg_rules = self.load_pkg_rules()
+        self.rule_engine = self.make_rule_engine(pkg_rules, stats=checker_stats)
+        self.custom_checks = self.rule_engine.custom_checks
+        self.pkgs_data = {pkg_name: PkgData(self.make_pkg_data(pkg_name, rule), self.resolve_nvr_lists)
+                          for pkg_name, rule in pkg_rules.items()}
 
-        return IsXIssue.MAYBE
+        # версии остальных пакетов вычисляются лениво, а версии ядра нужны сразу для подготовки путей
+        self.prefetch_nvrs(['kernel'])
 
+    # Нижеследующие функции проверяют, относится ли уязвимость к соответствующему пакету,
+    # для случаев, которые не укладываются в правила из pkg_rules.json
     @staticmethod
-    def is_tomcat_issue(desc, links, cpe) -> IsXIssue:
-        if 'tomcat' not in split_and_strip(desc):
-            return IsXIssue.NO
-
+    def is_kernel_issue(features: CveFeatures) -> IsXIssue:
+        """
+        Проверка на то, что уязвимость относится к ядреной
+        """
         check_urls = [
-            'list.apache.org',
-            'apache.org',
+            'lore.kernel.org',
+            'git.kernel.org',
+            'lkml.org',
+            'bugzilla.redhat.com',
+            'bugzilla.suse.com',
+            'cdn.kernel.org',
+            'lkml.kernel.org',
+            'kernel.dance',
+            'lists.debian.org',
+            'www.debian.org',
+            'www.spinics.net',
+            'patchwork.kernel.org',
         ]
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            if netloc in check_urls:
+        if ('linux kernel' not in features.desc) or ('android linux kernel' in features.desc):
+            return IsXIssue.NO
+
+        for netloc, path_split in features.urls:
+            if (netloc == 'github.com' and path_split[:1] == ['torvalds']) or (netloc in check_urls):
                 return IsXIssue.YES
 
-        if cpe and (cpe[0].split(":")[4] == 'tomcat'):
+        if 'linux_kernel' in features.cpe_products:
             return IsXIssue.YES
 
         return IsXIssue.MAYBE
 
     @staticmethod
-    def is_hdf5_issue(desc, links, cpe) -> IsXIssue:
-        if 'hdf5' not in split_and_strip(desc):
-            return IsXIssue.NO
+    def is_openssl_issue(features: CveFeatures) -> IsXIssue:
+        check_urls = [
+            'git.openssl.org',
+            'www.openssl.org',
+        ]
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
-            path_split = parse.urlparse(link).path.split('/')
-            if len(path_split) > 2:
-                if netloc == 'github.com' and \
-                        (path_split[1] == 'HDFGroup' and path_split[2] == 'hdf5'):
-                    return IsXIssue.YES
+        found_flag = 'openssl' in features.tokens
 
-        if cpe and (cpe[0].split(":")[4] == 'hdf5'):
-            return IsXIssue.YES
+        for netloc, _ in features.urls:
+            if netloc in check_urls and found_flag:
+                return IsXIssue.YES
+            elif netloc in check_urls and not found_flag:
+                return IsXIssue.MAYBE
 
-        return IsXIssue.MAYBE
+        return IsXIssue.NO
 
     @staticmethod
-    def is_xen_issue(desc, links, cpe) -> IsXIssue:
-        if 'xen' not in split_and_strip(desc):
+    def is_chromium_issue(features: CveFeatures) -> IsXIssue:
+        if 'chromium' not in features.tokens or \
+                (('google' not in features.tokens) and ('chrome' not in features.tokens)):
             return IsXIssue.NO
 
         check_urls = [
-            'xenbits.xenproject.org',
+            'crbug.com',
+            'chromereleases.googleblog.com',
+            'bugs.chromium.org',
+            'issues.chromium.org',
+            'chromium.org'
         ]
 
-        for link in links:
-            netloc = parse.urlparse(link).netloc
+        for netloc, _ in features.urls:
             if netloc in check_urls:
                 return IsXIssue.YES
 
+        if 'chrome' in features.cpe_products:
+            return IsXIssue.YES
+
         return IsXIssue.MAYBE